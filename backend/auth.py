@@ -0,0 +1,89 @@
+import os
+import time
+from datetime import datetime, timedelta
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session
+from cache import TTLCache
+from database import get_session, run_db
+import models
+import schemas
+
+# ─────────────────────────────────────────────
+# ENV VARIABLES
+# ─────────────────────────────────────────────
+SECRET_KEY = os.getenv("SECRET_KEY", "fallback_secret")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 10000))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", 30))
+
+security = HTTPBearer()
+
+# token -> user id, kept until the token's own `exp`
+_token_cache = TTLCache(TOKEN_CACHE_SIZE, ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+# user id -> schemas.UserProfileResponse snapshot
+_user_cache = TTLCache(USER_CACHE_SIZE, USER_CACHE_TTL)
+
+_credentials_error = HTTPException(
+    status_code=401,
+    detail="Invalid or expired token",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+# python-jose (and its crypto backends) is imported on first use to keep
+# it off the cold-start path.
+def create_access_token(data: dict) -> str:
+    from jose import jwt
+
+    to_encode = data.copy()
+    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_token(token: str) -> int:
+    user_id = _token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    from jose import JWTError, jwt
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = int(payload["sub"])
+        remaining = float(payload["exp"]) - time.time()
+    except (JWTError, KeyError, TypeError, ValueError):
+        raise _credentials_error
+    if remaining > 0:
+        _token_cache.set(token, user_id, ttl=remaining)
+    return user_id
+
+
+def revoke_token(token: str):
+    _token_cache.pop(token)
+
+
+def invalidate_user(user_id: int):
+    _user_cache.pop(user_id)
+
+
+def _load_user(db: Session, user_id: int):
+    user = db.get(models.User, user_id)
+    return None if user is None else schemas.UserProfileResponse.model_validate(user)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db=Depends(get_session),
+) -> schemas.UserProfileResponse:
+    user_id = decode_token(credentials.credentials)
+    user = _user_cache.get(user_id)
+    if user is None:
+        generation = _user_cache.generation
+        user = await run_db(db, _load_user, user_id)
+        if user is None:
+            raise _credentials_error
+        _user_cache.set(user_id, user, generation)
+    return user
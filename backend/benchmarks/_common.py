@@ -0,0 +1,92 @@
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# ─────────────────────────────────────────────
+# Shared helpers for the benchmark scripts
+#
+# Every script runs against BENCH_DATABASE_URL, or a throwaway SQLite file
+# when it is unset, and against the fake payment gateway unless
+# PAYMENT_GATEWAY says otherwise. This must run before `database` is
+# imported, since the engine is built at import time.
+# ─────────────────────────────────────────────
+def configure_database() -> str:
+    os.environ.setdefault("PAYMENT_GATEWAY", "fake")
+    os.environ.setdefault("PAYMENT_ALLOW_TEST_CONFIRM", "1" if os.environ["PAYMENT_GATEWAY"] == "fake" else "0")
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench-"), "bench.db")
+        url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+    return url
+
+
+CATEGORIES = ["Music", "Tech", "Sports", "Food", "Art", "Comedy", "Business"]
+CITIES = ["Mumbai", "Delhi", "Bengaluru", "Chennai", "Hyderabad", "Kochi", "Goa", "Pune", "Kolkata", "Jaipur"]
+WORDS = [
+    "live", "tour", "festival", "summit", "night", "concert", "workshop", "expo",
+    "masterclass", "league", "finals", "symphony", "comedy", "startup", "biryani",
+    "street", "art", "design", "cloud", "cricket", "football", "jazz", "indie",
+    "rock", "wine", "coffee", "marathon", "theatre", "film", "poetry",
+]
+
+
+def fake_event_rows(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    for i in range(n):
+        words = rng.sample(WORDS, 3)
+        city = rng.choice(CITIES)
+        yield {
+            "title": f"{words[0].title()} {words[1].title()} {i}",
+            "description": f"A {words[2]} {words[0]} event in {city} with {rng.choice(WORDS)} and {rng.choice(WORDS)}.",
+            "location": f"Venue {rng.randint(1, 500)}, {city}",
+            "date": start + timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+            "price": float(rng.choice([0, 299, 499, 999, 1999, 4999])),
+            "category": rng.choice(CATEGORIES),
+            "available_seats": rng.randint(50, 50000),
+            "is_active": True,
+        }
+
+
+def seed_events(engine, n: int, batch: int = 5000):
+    import models
+
+    rows = fake_event_rows(n)
+    with engine.begin() as conn:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == batch:
+                conn.execute(models.Event.__table__.insert(), chunk)
+                chunk = []
+        if chunk:
+            conn.execute(models.Event.__table__.insert(), chunk)
+
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize(samples) -> dict:
+    return {
+        "n": len(samples),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+    }
@@ -0,0 +1,88 @@
+"""Rows/sec of the bulk importer against per-object ORM inserts.
+
+    python -m benchmarks.bulk_import --rows 200000
+
+Writes --rows fake events to a CSV and an NDJSON file, then times:
+  orm_add      the seed.py pattern: db.add() per Event, one commit
+               (on --baseline-rows rows; it's too slow for the full set)
+  csv_insert   bulk_import of new events
+  csv_upsert   the same file again: every row hits ON CONFLICT
+  ndjson       a second set of new events, as NDJSON
+
+Nothing is deleted between runs: deletes leave tombstones in SQLite's
+FTS index that slow every later insert.
+"""
+import argparse
+import csv
+import json
+import os
+import tempfile
+import time
+
+from benchmarks._common import configure_database, fake_event_rows
+
+configure_database()
+
+import bulk_import  # noqa: E402
+import models  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import bootstrap  # noqa: E402
+
+FIELDS = ["title", "description", "location", "date", "price", "category", "image_url", "available_seats", "is_active"]
+
+
+def _write_files(rows: int, directory: str):
+    csv_path = os.path.join(directory, "events.csv")
+    ndjson_path = os.path.join(directory, "events.ndjson")
+    with open(csv_path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, FIELDS)
+        writer.writeheader()
+        for row in fake_event_rows(rows, seed=1):
+            writer.writerow({**row, "date": row["date"].isoformat()})
+    with open(ndjson_path, "w") as ndjson_file:
+        for row in fake_event_rows(rows, seed=2):
+            ndjson_file.write(json.dumps({**row, "date": row["date"].isoformat()}) + "\n")
+    return csv_path, ndjson_path
+
+
+def _orm_add(rows: int) -> dict:
+    db = SessionLocal()
+    t0 = time.perf_counter()
+    try:
+        for row in fake_event_rows(rows, seed=7):
+            db.add(models.Event(**row))
+        db.commit()
+    finally:
+        db.close()
+    seconds = time.perf_counter() - t0
+    return {"rows": rows, "seconds": round(seconds, 3), "rows_per_sec": round(rows / seconds, 1)}
+
+
+def _import(path: str, fmt: str, batch_size: int) -> dict:
+    with open(path, "rb") as stream:
+        result = bulk_import.run_import(stream, fmt, batch_size=batch_size)
+    return {k: result[k] for k in ("rows_read", "rows_written", "rows_invalid", "seconds", "rows_per_sec")}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--baseline-rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=bulk_import.IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    bootstrap.migrate(engine)
+    directory = tempfile.mkdtemp(prefix="bench-import-")
+    csv_path, ndjson_path = _write_files(args.rows, directory)
+
+    results = {"database": engine.dialect.name, "batch_size": args.batch_size}
+    results["orm_add"] = _orm_add(args.baseline_rows)
+    results["csv_insert"] = _import(csv_path, "csv", args.batch_size)
+    results["csv_upsert"] = _import(csv_path, "csv", args.batch_size)
+    results["ndjson"] = _import(ndjson_path, "ndjson", args.batch_size)
+    results["speedup_vs_orm_add"] = round(results["csv_insert"]["rows_per_sec"] / results["orm_add"]["rows_per_sec"], 1)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Cold start: interpreter + `import main` + first GET /events, per SCHEMA_CHECK mode.
+
+    python -m benchmarks.cold_start --runs 5
+
+Each run is a fresh interpreter. Point BENCH_DATABASE_URL at a remote
+Postgres (e.g. Neon) to see the round trips that each mode saves.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks._common import configure_database
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+queries = []
+event.listen(Engine, "before_cursor_execute", lambda conn, cur, stmt, *a: queries.append(stmt))
+import main
+t_import = time.perf_counter() - t0
+import_queries = len(queries)
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    t1 = time.perf_counter()
+    client.get("/events").raise_for_status()
+    t_first = time.perf_counter() - t1
+print(json.dumps({
+    "import_ms": t_import * 1000,
+    "first_request_ms": t_first * 1000,
+    "import_queries": import_queries,
+    "heavy_modules_loaded": [m for m in ("passlib", "jose", "razorpay") if m in sys.modules],
+}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    url = configure_database()
+    from database import SessionLocal, engine
+    import bootstrap
+    from seed import seed_events
+
+    bootstrap.migrate(engine)
+    db = SessionLocal()
+    seed_events(db)
+    db.close()
+
+    results = {"database": engine.dialect.name}
+    for mode in ("full", "fingerprint", "skip"):
+        env = {**os.environ, "DATABASE_URL": url, "SCHEMA_CHECK": mode, "PASSWORD_WORKERS": "0",
+               "HOLD_RELEASE_INTERVAL": "0", "PYTHONWARNINGS": "ignore"}
+        runs = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            out = subprocess.run([sys.executable, "-c", CHILD], env=env, capture_output=True, text=True)
+            wall = (time.perf_counter() - started) * 1000
+            if out.returncode:
+                sys.exit(out.stderr)
+            run = json.loads(out.stdout.strip().splitlines()[-1])
+            run["process_ms"] = wall
+            runs.append(run)
+        results[mode] = {
+            "process_ms": round(statistics.median(r["process_ms"] for r in runs), 1),
+            "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+            "first_request_ms": round(statistics.median(r["first_request_ms"] for r in runs), 1),
+            "import_queries": runs[-1]["import_queries"],
+            "heavy_modules_loaded": runs[-1]["heavy_modules_loaded"],
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Confirmations/sec: batched pipeline vs one transaction per confirmation.
+
+    python -m benchmarks.confirmations --bookings 5000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import configure_database, seed_events
+
+configure_database()
+
+from sqlalchemy import func, select  # noqa: E402
+from database import engine  # noqa: E402
+import confirmations  # noqa: E402
+import models  # noqa: E402
+
+
+def _seed_pending(prefix: str, n: int) -> list:
+    items = [(f"order_{prefix}_{i}", f"pay_{prefix}_{i}") for i in range(n)]
+    with engine.begin() as conn:
+        conn.execute(models.Booking.__table__.insert(), [
+            {"user_id": 1, "event_id": 1 + i % 100, "amount": 499.0, "quantity": 1,
+             "status": "pending", "razorpay_order_id": order_id}
+            for i, (order_id, _) in enumerate(items)
+        ])
+    return items
+
+
+def _confirmed(prefix: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(
+            select(func.count()).select_from(models.Booking).where(
+                models.Booking.razorpay_order_id.like(f"order_{prefix}_%"),
+                models.Booking.status == "confirmed",
+            )
+        ).scalar()
+
+
+def run_inline(items, concurrency: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(lambda item: confirmations._apply_batch([item]), items))
+    return time.perf_counter() - started
+
+
+async def run_pipeline(items) -> float:
+    pipeline = confirmations.ConfirmationPipeline()
+    task = pipeline.start()
+    started = time.perf_counter()
+    for order_id, payment_id in items:
+        await pipeline.submit(order_id, payment_id)
+    while len(pipeline.recent) < len(items):
+        await pipeline.wait_for_batch(0.05)
+    elapsed = time.perf_counter() - started
+    task.cancel()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    confirmations.CONFIRM_QUEUE_SIZE = max(confirmations.CONFIRM_QUEUE_SIZE, args.bookings)
+    models.Base.metadata.create_all(bind=engine)
+    seed_events(engine, 100)
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert().values(name="Payer", email="payer@example.com", hashed_password="x"))
+
+    inline_items = _seed_pending("inline", args.bookings)
+    batched_items = _seed_pending("batched", args.bookings)
+
+    inline = run_inline(inline_items, args.concurrency)
+    batched = asyncio.run(run_pipeline(batched_items))
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "confirmations": args.bookings,
+        "inline": {"per_sec": round(args.bookings / inline, 1), "confirmed": _confirmed("inline")},
+        "pipeline": {
+            "per_sec": round(args.bookings / batched, 1),
+            "confirmed": _confirmed("batched"),
+            "batch_size": confirmations.CONFIRM_BATCH_SIZE,
+            "batch_window_ms": confirmations.CONFIRM_BATCH_WINDOW_MS,
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
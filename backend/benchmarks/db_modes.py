@@ -0,0 +1,90 @@
+"""Requests/sec and latency of the sync (threadpool) vs async DB modes.
+
+    python -m benchmarks.db_modes --events 20000 --concurrency 64 --requests 2000
+
+Each mode runs in its own interpreter because DB_MODE is read at import
+time. The catalog cache is disabled so every request reaches the database.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks._common import configure_database, seed_events, summarize
+
+PATHS = [
+    "/events?limit=20",
+    "/events?category=Music&limit=20",
+    "/events?search=jazz&limit=20",
+    "/events?search=mumbai%20festival&limit=20",
+]
+
+
+async def _drive(concurrency: int, total: int) -> dict:
+    import httpx
+    import main
+
+    transport = httpx.ASGITransport(app=main.app)
+    samples = []
+    counter = iter(range(total))
+
+    async def worker(client):
+        for i in counter:
+            t0 = time.perf_counter()
+            res = await client.get(PATHS[i % len(PATHS)])
+            res.raise_for_status()
+            samples.append((time.perf_counter() - t0) * 1000)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {"requests_per_sec": round(total / elapsed, 1), **summarize(samples)}
+
+
+def run_worker(args):
+    result = asyncio.run(_drive(args.concurrency, args.requests))
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    url = configure_database()
+    from database import engine
+    import fulltext
+    import models
+
+    models.Base.metadata.create_all(bind=engine)
+    fulltext.ensure_search_index(engine)
+    seed_events(engine, args.events)
+    engine.dispose()
+
+    results = {"database": engine.dialect.name, "events": args.events, "concurrency": args.concurrency}
+    for mode in ("sync", "async"):
+        env = {**os.environ, "DATABASE_URL": url, "BENCH_DATABASE_URL": url, "DB_MODE": mode, "EVENTS_CACHE_SIZE": "0"}
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.db_modes", "--worker",
+             "--concurrency", str(args.concurrency), "--requests", str(args.requests)],
+            env=env, capture_output=True, text=True,
+        )
+        if out.returncode:
+            sys.exit(out.stderr)
+        results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Query-plan regression check: EXPLAIN every query each route issues.
+
+    python -m benchmarks.explain_plans --events 100000 --users 10000 --bookings 200000
+
+Runs the route helpers against a seeded dataset, captures the SQL they
+send, EXPLAINs each statement and exits non-zero when one of them reads
+events, bookings or users with a full table scan instead of an index.
+Point BENCH_DATABASE_URL at a Postgres database to check the production
+planner; SQLite is used otherwise.
+"""
+import argparse
+import json
+import random
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+
+from benchmarks._common import configure_database, seed_events
+
+configure_database()
+
+from sqlalchemy import event, text  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import auth  # noqa: E402
+import confirmations  # noqa: E402
+import main as routes  # noqa: E402  (importing it creates the schema)
+import models  # noqa: E402
+import reservations  # noqa: E402
+
+LARGE_TABLES = {"events", "bookings", "users"}
+STATUSES = ["confirmed"] * 6 + ["pending", "cancelled", "expired"]
+SEEDED = {}
+
+
+def seed(events: int, users: int, bookings: int, batch: int = 5000):
+    seed_events(engine, events)
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert(), [
+            {"name": f"User {i}", "email": f"user{i}@example.com", "hashed_password": "x"}
+            for i in range(users)
+        ])
+        rows = []
+        for i in range(bookings):
+            status = rng.choice(STATUSES)
+            rows.append({
+                "user_id": rng.randint(1, users),
+                "event_id": rng.randint(1, events),
+                "razorpay_order_id": f"order_seed_{i}",
+                "amount": 499.0,
+                "quantity": 1,
+                "status": status,
+                "hold_expires_at": now + timedelta(minutes=rng.randint(-30, 30)) if status == "pending" else None,
+                "booked_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+            })
+            if len(rows) == batch:
+                conn.execute(models.Booking.__table__.insert(), rows)
+                rows = []
+        if rows:
+            conn.execute(models.Booking.__table__.insert(), rows)
+        conn.execute(text("ANALYZE"))
+        SEEDED["booking"] = tuple(conn.execute(
+            text("SELECT id, user_id FROM bookings WHERE razorpay_order_id = 'order_seed_9'")
+        ).one())
+
+
+# ─────────────────────────────────────────────
+# Route scenarios: each runs the same helpers the route runs
+# ─────────────────────────────────────────────
+def _events_pages(db):
+    routes._load_events(db, None, None, 50, None)
+    body, cursor = routes._load_events(db, None, None, 50, None)
+    routes._load_events(db, None, None, 50, cursor)
+
+
+def _hold_and_cancel(db):
+    booking = reservations.hold_seats(db, 1, 1, 1)
+    reservations.cancel_hold(db, booking.id, 1)
+
+
+def _status_poll(db):
+    booking_id, user_id = SEEDED["booking"]
+    routes._booking_for_order(db, "order_seed_9", user_id)
+    routes._booking_status(db, booking_id, user_id)
+
+
+SCENARIOS = {
+    "GET /events": lambda db: routes._load_events(db, None, None, None, None),
+    "GET /events?limit&cursor": _events_pages,
+    "GET /events?category": lambda db: routes._load_events(db, None, "music", None, None),
+    "GET /events?category&limit": lambda db: routes._load_events(db, None, "music", 50, None),
+    "GET /events?search": lambda db: routes._load_events(db, "jazz", None, None, None),
+    "GET /events?search&limit": lambda db: routes._load_events(db, "jazz night", None, 50, None),
+    "POST /auth/login": lambda db: routes._find_user(db, "user42@example.com"),
+    "auth (current user)": lambda db: auth._load_user(db, 42),
+    "GET /profile/bookings": lambda db: routes._load_bookings(db, 42, False, None, None),
+    "GET /profile/bookings?summary&limit": lambda db: routes._load_bookings(db, 42, True, 20, None),
+    "POST /bookings/hold + DELETE /bookings/{id}": _hold_and_cancel,
+    "POST /payment/create-order": lambda db: (routes._event_price(db, 1), routes._attach_order(db, 1, "order_explain_1")),
+    "POST /payment/verify": lambda db: confirmations.apply_confirmations(db, [("order_seed_5", "pay_x"), ("order_seed_6", "pay_y")]),
+    "GET /bookings/{id}/status": _status_poll,
+    "hold sweeper": lambda db: reservations.release_expired_holds(db),
+    "hold sweeper (one event)": lambda db: reservations.release_expired_holds(db, event_id=3),
+}
+
+
+def capture(scenario):
+    statements = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().split(None, 1)[0].upper() in ("SELECT", "UPDATE", "DELETE", "WITH"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", listener)
+    db = SessionLocal()
+    try:
+        scenario(db)
+    except Exception as e:
+        # A 404/409 from the helper still issued its queries
+        print(f"  note: {type(e).__name__}: {getattr(e, 'detail', e)}", file=sys.stderr)
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+# ─────────────────────────────────────────────
+# Plan inspection
+# ─────────────────────────────────────────────
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(.*)$")
+
+
+def _sqlite_plan(conn, statement, parameters):
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    plan = [row[-1] for row in rows]
+    scans = []
+    for detail in plan:
+        match = _SQLITE_SCAN.match(detail)
+        if match and match.group(1) in LARGE_TABLES and "USING" not in match.group(2):
+            scans.append(match.group(1))
+    return plan, scans
+
+
+def _pg_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _pg_nodes(child)
+
+
+def _pg_plan(conn, statement, parameters):
+    raw = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+    root = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    plan, scans = [], []
+    for node in _pg_nodes(root):
+        relation = node.get("Relation Name")
+        plan.append(f"{node['Node Type']} {relation or ''} {node.get('Index Name', '')}".strip())
+        if node["Node Type"] == "Seq Scan" and relation in LARGE_TABLES:
+            scans.append(relation)
+    return plan, scans
+
+
+def explain(statement, parameters):
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            return _pg_plan(conn, statement, parameters)
+        return _sqlite_plan(conn, statement, parameters)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--bookings", type=int, default=200_000)
+    parser.add_argument("--verbose", action="store_true", help="print every plan, not just failures")
+    args = parser.parse_args()
+
+    seed(args.events, args.users, args.bookings)
+
+    report, failures = {"dialect": engine.dialect.name, "routes": {}}, []
+    for route, scenario in SCENARIOS.items():
+        checked = []
+        seen = set()
+        for statement, parameters in capture(scenario):
+            if statement in seen:
+                continue
+            seen.add(statement)
+            plan, scans = explain(statement, parameters)
+            entry = {"sql": " ".join(statement.split()), "full_scans": scans}
+            if scans or args.verbose:
+                entry["plan"] = plan
+            if scans:
+                failures.append((route, entry["sql"], scans))
+            checked.append(entry)
+        report["routes"][route] = checked
+
+    report["failures"] = len(failures)
+    print(json.dumps(report, indent=2))
+    for route, sql, scans in failures:
+        print(f"FULL SCAN of {', '.join(scans)} in {route}: {sql}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
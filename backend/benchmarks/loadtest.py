@@ -0,0 +1,366 @@
+"""End-to-end load test: boot main:app under uvicorn and drive a request mix.
+
+    python -m benchmarks.loadtest --mix mixed --concurrency 32 --duration 30 \\
+        --users 1000 --events 5000 --bookings 20000 --output results.json
+
+Seeds a throwaway SQLite database (or BENCH_DATABASE_URL), starts the API
+in its own process and runs `--concurrency` clients for `--duration`
+seconds. Reports requests/sec, p50/p95/p99 latency, status codes and DB
+queries per request for every route, as JSON on stdout and in --output.
+The git commit and config are included so runs can be compared.
+
+Mixes (see MIXES): browse, auth, booking, mixed.
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks._common import CATEGORIES, WORDS, configure_database, percentile, seed_events
+
+PASSWORD = "loadtest-password"
+QUERIES_PATH = "/__loadtest/queries"
+
+# ─────────────────────────────────────────────
+# Server side: main:app plus per-route query counting
+# ─────────────────────────────────────────────
+_request_queries = contextvars.ContextVar("request_queries", default=None)
+
+
+class QueryCounter:
+    """ASGI middleware: attributes every SQL statement to the route template
+    of the request that issued it. Statements outside a request (startup,
+    sweeper, confirmation pipeline) are counted under "background"."""
+
+    def __init__(self, app):
+        self.app = app
+        self.totals = {}
+
+    def record(self):
+        counter = _request_queries.get()
+        if counter is None:
+            counter = self.totals.setdefault("background", {"requests": 0, "queries": 0})
+        counter["queries"] += 1
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        if scope["path"] == QUERIES_PATH:
+            body = json.dumps(self.totals).encode()
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"application/json")]})
+            return await send({"type": "http.response.body", "body": body})
+
+        current = {"queries": 0}
+        _request_queries.set(current)
+
+        async def finish(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                route = scope.get("route")
+                label = f"{scope['method']} {route.path if route else scope['path']}"
+                totals = self.totals.setdefault(label, {"requests": 0, "queries": 0})
+                totals["requests"] += 1
+                totals["queries"] += current["queries"]
+
+        await self.app(scope, receive, finish)
+
+
+def serve(port: int):
+    import uvicorn
+    from sqlalchemy import event
+    from database import async_engine, engine
+    from main import app
+
+    counter = QueryCounter(app)
+    event.listen(engine, "before_cursor_execute", lambda *_: counter.record())
+    if async_engine is not None:
+        event.listen(async_engine.sync_engine, "before_cursor_execute", lambda *_: counter.record())
+    uvicorn.run(counter, host="127.0.0.1", port=port, log_level="warning")
+
+
+# ─────────────────────────────────────────────
+# Seeding
+# ─────────────────────────────────────────────
+def seed(users: int, events: int, bookings: int) -> dict:
+    from database import engine
+    import bootstrap
+    import models
+    import passwords
+
+    bootstrap.migrate(engine)
+    seed_events(engine, events)
+    hashed = passwords.hash_password(PASSWORD)
+    rng = random.Random(11)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert(), [
+            {"name": f"Load {i}", "email": f"load{i}@example.com", "hashed_password": hashed}
+            for i in range(users)
+        ])
+        for start in range(0, bookings, 5000):
+            conn.execute(models.Booking.__table__.insert(), [
+                {"user_id": rng.randint(1, users), "event_id": rng.randint(1, events),
+                 "razorpay_order_id": f"order_load_{i}", "razorpay_payment_id": f"pay_load_{i}",
+                 "amount": 499.0, "quantity": 1, "status": "confirmed",
+                 "booked_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))}
+                for i in range(start, min(start + 5000, bookings))
+            ])
+    return {"users": users, "events": events, "bookings": bookings}
+
+
+# ─────────────────────────────────────────────
+# Workloads
+#
+# Each operation is an async function (client, ctx) issuing one or more
+# requests through ctx.request(), which records latency under the route.
+# ─────────────────────────────────────────────
+class Context:
+    def __init__(self, args, tokens):
+        self.args = args
+        self.tokens = tokens
+        self.rng = random.Random()
+        self.samples = {}
+        self.statuses = {}
+        self.registered = 0
+
+    def user(self):
+        user_id = self.rng.randint(1, self.args.users)
+        return user_id, {"Authorization": f"Bearer {self.tokens[user_id]}"}
+
+    async def request(self, client, route, method, url, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            res = await client.request(method, url, **kwargs)
+            status = res.status_code
+        except Exception as e:
+            res, status = None, type(e).__name__
+        self.samples.setdefault(route, []).append((time.perf_counter() - t0) * 1000)
+        codes = self.statuses.setdefault(route, {})
+        codes[str(status)] = codes.get(str(status), 0) + 1
+        return res
+
+
+async def browse_events(client, ctx):
+    await ctx.request(client, "GET /events", "GET", "/events")
+
+
+async def browse_page(client, ctx):
+    res = await ctx.request(client, "GET /events", "GET", "/events", params={"limit": 50})
+    cursor = res is not None and res.headers.get("X-Next-Cursor")
+    if cursor:
+        await ctx.request(client, "GET /events", "GET", "/events", params={"limit": 50, "cursor": cursor})
+
+
+async def browse_category(client, ctx):
+    await ctx.request(client, "GET /events", "GET", "/events",
+                      params={"category": ctx.rng.choice(CATEGORIES), "limit": 50})
+
+
+async def search_events(client, ctx):
+    await ctx.request(client, "GET /events", "GET", "/events",
+                      params={"search": ctx.rng.choice(WORDS), "limit": 50})
+
+
+async def login(client, ctx):
+    email = f"load{ctx.rng.randint(0, ctx.args.users - 1)}@example.com"
+    await ctx.request(client, "POST /auth/login", "POST", "/auth/login",
+                      json={"email": email, "password": PASSWORD})
+
+
+async def register(client, ctx):
+    ctx.registered += 1
+    email = f"new{os.getpid()}-{ctx.registered}-{ctx.rng.randrange(1 << 30)}@example.com"
+    await ctx.request(client, "POST /auth/register", "POST", "/auth/register",
+                      json={"name": "New User", "email": email, "password": PASSWORD})
+
+
+async def my_bookings(client, ctx):
+    _, headers = ctx.user()
+    await ctx.request(client, "GET /profile/bookings", "GET", "/profile/bookings",
+                      params={"summary": "true", "limit": 20}, headers=headers)
+
+
+async def book_and_pay(client, ctx):
+    _, headers = ctx.user()
+    event_id = ctx.rng.randint(1, ctx.args.events)
+    res = await ctx.request(client, "POST /payment/create-order", "POST", "/payment/create-order",
+                            json={"event_id": event_id, "quantity": 1}, headers=headers)
+    if res is None or res.status_code != 200:
+        return
+    order = res.json()
+    await ctx.request(client, "POST /payment/confirm-test", "POST", "/payment/confirm-test",
+                      json={"razorpay_order_id": order["order_id"],
+                            "razorpay_payment_id": f"pay_{order['order_id']}"},
+                      headers=headers)
+    await ctx.request(client, "GET /bookings/{booking_id}/status", "GET",
+                      f"/bookings/{order['booking_id']}/status", params={"wait": 2}, headers=headers)
+
+
+async def hold_and_release(client, ctx):
+    _, headers = ctx.user()
+    res = await ctx.request(client, "POST /bookings/hold", "POST", "/bookings/hold",
+                            json={"event_id": ctx.rng.randint(1, ctx.args.events), "quantity": 1},
+                            headers=headers)
+    if res is not None and res.status_code == 200:
+        await ctx.request(client, "DELETE /bookings/{booking_id}", "DELETE",
+                          f"/bookings/{res.json()['booking_id']}", headers=headers)
+
+
+MIXES = {
+    "browse": [(40, browse_events), (25, browse_page), (20, browse_category), (15, search_events)],
+    "auth": [(85, login), (15, register)],
+    "booking": [(50, book_and_pay), (30, hold_and_release), (20, my_bookings)],
+    "mixed": [
+        (30, browse_events), (15, browse_page), (10, browse_category), (15, search_events),
+        (8, my_bookings), (6, book_and_pay), (4, hold_and_release), (10, login), (2, register),
+    ],
+}
+
+
+async def drive(args, tokens) -> dict:
+    import httpx
+
+    weights, operations = zip(*((w, op) for w, op in MIXES[args.mix]))
+    ctx = Context(args, tokens)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=60, limits=limits) as client:
+        # Warm-up: first login waits for the password workers to spawn
+        await login(client, ctx)
+        deadline = time.perf_counter() + args.warmup
+        while time.perf_counter() < deadline:
+            await browse_events(client, ctx)
+        ctx.samples.clear()
+        ctx.statuses.clear()
+        queries_before = (await client.get(QUERIES_PATH)).json()
+
+        async def worker():
+            while time.perf_counter() < stop_at:
+                await ctx.rng.choices(operations, weights)[0](client, ctx)
+
+        started = time.perf_counter()
+        stop_at = started + args.duration
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        queries_after = (await client.get(QUERIES_PATH)).json()
+
+    routes = {}
+    for route, samples in sorted(ctx.samples.items()):
+        after = queries_after.get(route, {"requests": 0, "queries": 0})
+        before = queries_before.get(route, {"requests": 0, "queries": 0})
+        served = after["requests"] - before["requests"]
+        routes[route] = {
+            "requests": len(samples),
+            "rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p95_ms": round(percentile(samples, 95), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "statuses": ctx.statuses[route],
+            "queries_per_request": round((after["queries"] - before["queries"]) / served, 2) if served else None,
+        }
+    total = sum(len(s) for s in ctx.samples.values())
+    background = queries_after.get("background", {"queries": 0})["queries"] - \
+        queries_before.get("background", {"queries": 0})["queries"]
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "rps": round(total / elapsed, 1),
+        "background_queries": background,
+        "routes": routes,
+    }
+
+
+# ─────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_up(url: str, server, timeout: float = 60):
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"server exited with code {server.returncode}")
+        try:
+            if httpx.get(url + "/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("server did not come up")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--bookings", type=int, default=20000)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--rate-limit", action="store_true", help="keep the auth/payment rate limits on")
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    url = configure_database()
+    if args.serve:
+        return serve(args.serve)
+
+    seeded = seed(args.users, args.events, args.bookings)
+    from auth import create_access_token
+    tokens = {i: create_access_token({"sub": str(i)}) for i in range(1, args.users + 1)}
+
+    port = _free_port()
+    args.url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.loadtest", "--serve", str(port)],
+        # Every simulated client shares one IP; --rate-limit keeps the limiter on
+        env={**os.environ, "BENCH_DATABASE_URL": url, "RATE_LIMIT_ENABLED": "1" if args.rate_limit else "0"},
+    )
+    try:
+        _wait_until_up(args.url, server)
+        results = asyncio.run(drive(args, tokens))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    report = {
+        "commit": _git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "mix": args.mix, "concurrency": args.concurrency, "duration_s": args.duration,
+            "dialect": url.split(":", 1)[0], "db_mode": os.getenv("DB_MODE", "sync"),
+            "rate_limit": args.rate_limit, **seeded,
+        },
+        **results,
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
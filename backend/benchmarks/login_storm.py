@@ -0,0 +1,120 @@
+"""/events latency before and during a login storm.
+
+    python -m benchmarks.login_storm --logins 400 --storm-concurrency 64
+
+Runs once with bcrypt inline on the threadpool (PASSWORD_WORKERS=0) and
+once with the process pool, each in its own interpreter.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks._common import configure_database, seed_events, summarize
+
+EMAIL = "storm@example.com"
+PASSWORD = "correct horse battery staple"
+
+
+async def _probe(client, count: int) -> list:
+    samples = []
+    for i in range(count):
+        t0 = time.perf_counter()
+        res = await client.get(f"/events?limit=20&search=jazz&page={i}")
+        res.raise_for_status()
+        samples.append((time.perf_counter() - t0) * 1000)
+        await asyncio.sleep(0.005)
+    return samples
+
+
+async def _drive(args) -> dict:
+    import httpx
+    import main
+
+    transport = httpx.ASGITransport(app=main.app)
+    statuses = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        baseline = await _probe(client, args.probes)
+
+        remaining = iter(range(args.logins))
+
+        async def stormer():
+            for _ in remaining:
+                res = await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+                statuses[res.status_code] = statuses.get(res.status_code, 0) + 1
+
+        started = time.perf_counter()
+        storm = asyncio.gather(*(stormer() for _ in range(args.storm_concurrency)))
+        during = await _probe(client, args.probes)
+        await storm
+        elapsed = time.perf_counter() - started
+
+    main.passwords.password_pool.shutdown()
+    return {
+        "events_baseline": summarize(baseline),
+        "events_during_storm": summarize(during),
+        "logins_per_sec": round(args.logins / elapsed, 1),
+        "login_statuses": statuses,
+    }
+
+
+def run_worker(args):
+    print(json.dumps(asyncio.run(_drive(args))))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--storm-concurrency", type=int, default=64)
+    parser.add_argument("--probes", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return run_worker(args)
+
+    url = configure_database()
+    from database import SessionLocal, engine
+    import fulltext
+    import models
+    import passwords
+
+    models.Base.metadata.create_all(bind=engine)
+    fulltext.ensure_search_index(engine)
+    seed_events(engine, args.events)
+    db = SessionLocal()
+    db.add(models.User(name="Storm", email=EMAIL, hashed_password=passwords.hash_password(PASSWORD)))
+    db.commit()
+    db.close()
+    engine.dispose()
+
+    results = {"database": engine.dialect.name, "logins": args.logins, "storm_concurrency": args.storm_concurrency}
+    for label, workers in (("inline", 0), ("process_pool", args.workers)):
+        env = {
+            **os.environ,
+            "DATABASE_URL": url,
+            "PASSWORD_WORKERS": str(workers),
+            "PASSWORD_MAX_PENDING": str(args.storm_concurrency * 2),
+            "EVENTS_CACHE_SIZE": "0",
+            "RATE_LIMIT_ENABLED": "0",  # the storm is one IP hammering one account
+        }
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.login_storm", "--worker",
+             "--logins", str(args.logins), "--storm-concurrency", str(args.storm_concurrency),
+             "--probes", str(args.probes)],
+            env=env, capture_output=True, text=True,
+        )
+        if out.returncode:
+            sys.exit(out.stderr)
+        results[label] = json.loads(out.stdout.strip().splitlines()[-1])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
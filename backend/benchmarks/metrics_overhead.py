@@ -0,0 +1,87 @@
+"""Request overhead of METRICS_ENABLED=1 on catalog and profile routes.
+
+    python -m benchmarks.metrics_overhead --requests 3000
+
+Runs the same request sequence in two interpreters, with metrics off
+and on, and reports the relative change in mean latency. The catalog
+cache is disabled so every request reaches the database hooks.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks._common import configure_database, seed_events, summarize
+
+PATHS = ["/events?limit=20", "/events?category=music&limit=20", "/events?search=jazz&limit=20", "/profile"]
+
+
+async def _drive(args) -> dict:
+    import httpx
+    from auth import create_access_token
+    import main
+
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': '1'})}"}
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in PATHS:  # warm-up
+            (await client.get(path, headers=headers)).raise_for_status()
+        samples = []
+        for i in range(args.requests):
+            t0 = time.perf_counter()
+            res = await client.get(PATHS[i % len(PATHS)], headers=headers)
+            samples.append((time.perf_counter() - t0) * 1000)
+            res.raise_for_status()
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=3, help="alternate off/on runs, keep the best of each")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return print(json.dumps(asyncio.run(_drive(args))))
+
+    url = configure_database()
+    from database import engine
+    import bootstrap
+    import models
+
+    bootstrap.migrate(engine)
+    seed_events(engine, args.events)
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert().values(name="Bench", email="bench@example.com", hashed_password="x"))
+    engine.dispose()
+
+    runs = {"off": [], "on": []}
+    for _ in range(args.rounds):
+        for label, enabled in (("off", "0"), ("on", "1")):
+            env = {**os.environ, "DATABASE_URL": url, "METRICS_ENABLED": enabled,
+                   "EVENTS_CACHE_SIZE": "0", "PASSWORD_WORKERS": "0", "SCHEMA_CHECK": "skip"}
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.metrics_overhead", "--worker", "--requests", str(args.requests)],
+                env=env, capture_output=True, text=True,
+            )
+            if out.returncode:
+                sys.exit(out.stderr)
+            runs[label].append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    best = {label: min(samples, key=lambda s: s["mean_ms"]) for label, samples in runs.items()}
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "requests": args.requests,
+        "metrics_off": best["off"],
+        "metrics_on": best["on"],
+        "mean_overhead_pct": round((best["on"]["mean_ms"] / best["off"]["mean_ms"] - 1) * 100, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
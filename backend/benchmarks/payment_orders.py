@@ -0,0 +1,88 @@
+"""Throughput and latency of POST /payment/create-order on the fake gateway.
+
+    FAKE_GATEWAY_LATENCY_MS=80 python -m benchmarks.payment_orders --users 200 --retries 3
+
+Every user sends the same order request `--retries` times concurrently,
+the way a flaky mobile connection would. The run reports how many gateway
+orders were actually created: one per user, minus free events, which
+never reach the gateway.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from benchmarks._common import configure_database, seed_events, summarize
+
+configure_database()
+os.environ.setdefault("RATE_LIMIT_ENABLED", "0")  # every simulated user shares one IP
+os.environ.setdefault("FAKE_GATEWAY_LATENCY_MS", "80")
+
+import httpx  # noqa: E402
+from auth import create_access_token  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+from main import app  # noqa: E402
+import models  # noqa: E402
+import payments  # noqa: E402
+
+
+async def _drive(args, user_ids):
+    calls = {"gateway": 0}
+    create_order = payments.get_gateway().create_order
+
+    def counting_create_order(*a, **kw):
+        calls["gateway"] += 1
+        return create_order(*a, **kw)
+
+    payments.get_gateway().create_order = counting_create_order
+    samples, order_ids = [], set()
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def buy(client, user_id):
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+        async with sem:
+            t0 = time.perf_counter()
+            res = await client.post("/payment/create-order", json={"event_id": 1 + user_id % 50}, headers=headers)
+            res.raise_for_status()
+            samples.append((time.perf_counter() - t0) * 1000)
+            order_ids.add(res.json()["order_id"])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(buy(client, uid) for uid in user_ids for _ in range(args.retries)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "users": len(user_ids),
+        "requests": len(samples),
+        "requests_per_sec": round(len(samples) / elapsed, 1),
+        "distinct_orders": len(order_ids),
+        "gateway_calls": calls["gateway"],
+        **summarize(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    seed_events(engine, 50)
+    db = SessionLocal()
+    users = [models.User(name=f"Buyer {i}", email=f"buyer{i}@example.com", hashed_password="x") for i in range(args.users)]
+    db.add_all(users)
+    db.commit()
+    user_ids = [u.id for u in users]
+    db.close()
+
+    result = asyncio.run(_drive(args, user_ids))
+    result["gateway_latency_ms"] = payments.FAKE_GATEWAY_LATENCY_MS
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
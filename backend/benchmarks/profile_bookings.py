@@ -0,0 +1,88 @@
+"""Query count and latency of GET /profile/bookings for a heavy user.
+
+    python -m benchmarks.profile_bookings --bookings 500
+
+Exits non-zero if the full listing takes more than two SELECTs (bookings
+plus one IN-list for their events) or the summary listing more than one,
+i.e. if the N+1 lazy load comes back, or if walking the listing page by
+page (both modes) repeats or skips a booking.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks._common import configure_database, seed_events, summarize, timed
+
+configure_database()
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from auth import create_access_token  # noqa: E402
+from database import engine  # noqa: E402
+from main import app  # noqa: E402
+import models  # noqa: E402
+
+MAX_QUERIES = {"full": 2, "summary": 1}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    seed_events(engine, max(args.bookings, 100))
+    with engine.begin() as conn:
+        user_id = conn.execute(models.User.__table__.insert().values(
+            name="Heavy", email="heavy@example.com", hashed_password="x"
+        )).inserted_primary_key[0]
+        # booked_at comes from the column default, as it does for real holds
+        conn.execute(models.Booking.__table__.insert(), [
+            {"user_id": user_id, "event_id": i + 1, "amount": 499.0, "quantity": 1, "status": "confirmed"}
+            for i in range(args.bookings)
+        ])
+
+    selects = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, *_):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+    client.get("/profile", headers=headers)  # warm the auth caches
+
+    results, failed = {"bookings": args.bookings}, False
+    for mode, params in (("full", {}), ("summary", {"summary": "true"})):
+        selects.clear()
+        res = client.get("/profile/bookings", params=params, headers=headers)
+        res.raise_for_status()
+        assert len(res.json()) == args.bookings
+        queries = len(selects)
+        failed |= queries > MAX_QUERIES[mode]
+        results[mode] = {
+            "queries": queries,
+            **summarize(timed(lambda: client.get("/profile/bookings", params=params, headers=headers), args.repeat)),
+        }
+
+    for mode, params in (("full", {}), ("summary", {"summary": "true"})):
+        ids, pages, cursor = [], 0, None
+        while pages <= args.bookings:
+            res = client.get("/profile/bookings", params={**params, "limit": 50, "cursor": cursor}, headers=headers)
+            res.raise_for_status()
+            ids += [booking["id"] for booking in res.json()]
+            pages += 1
+            cursor = res.headers.get("x-next-cursor")
+            if not cursor:
+                break
+        complete = len(ids) == len(set(ids)) == args.bookings
+        failed |= not complete
+        results[f"{mode}_pages"] = {"pages": pages, "rows": len(ids), "distinct": len(set(ids)), "complete": complete}
+
+    print(json.dumps(results, indent=2))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
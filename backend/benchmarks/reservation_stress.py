@@ -0,0 +1,106 @@
+"""Concurrent seat-hold stress test: proves no oversell, reports holds/sec.
+
+    python -m benchmarks.reservation_stress --seats 2000 --workers 32
+
+Many threads race to hold seats on one event until it sells out. The run
+fails (exit 1) if more seats were handed out than existed, or if the
+event's counter disagrees with the bookings table.
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+
+from benchmarks._common import configure_database
+
+configure_database()
+
+from fastapi import HTTPException  # noqa: E402
+from sqlalchemy import func  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import models  # noqa: E402
+import reservations  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seats", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--max-quantity", type=int, default=4)
+    args = parser.parse_args()
+
+    models.Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = models.User(name="Stress", email="stress@example.com", hashed_password="x")
+    event = models.Event(
+        title="Stress Test Arena", location="Nowhere", date=datetime(2030, 1, 1),
+        price=100, category="Music", available_seats=args.seats, is_active=True,
+    )
+    db.add_all([user, event])
+    db.commit()
+    user_id, event_id = user.id, event.id
+    db.close()
+
+    counts = {"held": 0, "sold_out": 0, "retried": 0}
+    lock = threading.Lock()
+
+    def worker(n):
+        db = SessionLocal()
+        quantity = 1 + n % args.max_quantity
+        try:
+            while True:
+                try:
+                    reservations.hold_seats(db, user_id, event_id, quantity)
+                    key = "held"
+                except HTTPException:
+                    # Sold out for this quantity; fall back to single seats
+                    if quantity == 1:
+                        with lock:
+                            counts["sold_out"] += 1
+                        return
+                    quantity = 1
+                    continue
+                except OperationalError:
+                    db.rollback()
+                    key = "retried"
+                with lock:
+                    counts[key] += 1
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.workers)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    db = SessionLocal()
+    remaining = db.get(models.Event, event_id).available_seats
+    held = db.query(func.coalesce(func.sum(models.Booking.quantity), 0)).filter(
+        models.Booking.event_id == event_id, models.Booking.status == "pending"
+    ).scalar()
+    db.close()
+
+    ok = remaining == 0 and held == args.seats
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "seats": args.seats,
+        "workers": args.workers,
+        "holds": counts["held"],
+        "seats_held": held,
+        "seats_remaining": remaining,
+        "lock_retries": counts["retried"],
+        "holds_per_sec": round(counts["held"] / elapsed, 1),
+        "oversold": held > args.seats,
+        "consistent": ok,
+    }, indent=2))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
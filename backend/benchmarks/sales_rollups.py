@@ -0,0 +1,157 @@
+"""Reporting queries: sales rollups against ad-hoc aggregates over bookings.
+
+    python -m benchmarks.sales_rollups --bookings 2000000
+
+Seeds --bookings bookings (80% confirmed) over a year, --events events
+and --users users, builds the rollups with sales.rebuild(), then times
+each report both ways: the rollup read the /reports routes use, and
+the GROUP BY over bookings (joined to events where needed) it replaces.
+Also reports what the rollups add to one confirmation batch.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks._common import configure_database, seed_events, summarize, timed
+
+configure_database()
+
+from sqlalchemy import func, select, text  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import bootstrap  # noqa: E402
+import confirmations  # noqa: E402
+import models  # noqa: E402
+import sales  # noqa: E402
+
+START = datetime(2025, 1, 1)
+PERIOD = (date(2025, 10, 1), date(2025, 12, 31))
+
+
+def _seed_bookings(n: int, events: int, users: int, batch: int = 20000):
+    rng = random.Random(7)
+    prices = dict(enumerate([0, 299, 499, 999, 1999, 4999]))
+    with engine.begin() as conn:
+        conn.execute(models.User.__table__.insert(), [
+            {"name": f"User {i}", "email": f"user{i}@example.com", "hashed_password": "x"} for i in range(users)
+        ])
+        rows = []
+        for _ in range(n):
+            quantity = rng.randint(1, 4)
+            rows.append({
+                "user_id": rng.randint(1, users), "event_id": rng.randint(1, events),
+                "amount": float(prices[rng.randrange(6)] * quantity), "quantity": quantity,
+                "status": "confirmed" if rng.random() < 0.8 else rng.choice(["cancelled", "expired", "pending"]),
+                "booked_at": START + timedelta(seconds=rng.randrange(365 * 86400)),
+            })
+            if len(rows) == batch:
+                conn.execute(models.Booking.__table__.insert(), rows)
+                rows = []
+        if rows:
+            conn.execute(models.Booking.__table__.insert(), rows)
+
+
+def _adhoc(db, group: str, start: date = None, end: date = None, limit: int = 50):
+    booking, event = models.Booking, models.Event
+    day = sales.booking_day(engine.dialect.name)
+    key = {"event": booking.event_id, "category": event.category, "day": day}[group]
+    revenue = func.sum(booking.amount)
+    query = select(key, func.count(), func.sum(booking.quantity), revenue).where(booking.status == "confirmed")
+    if group == "category":
+        query = query.join(event, event.id == booking.event_id)
+    if start is not None:
+        query = query.where(booking.booked_at >= start, booking.booked_at < end + timedelta(days=1))
+    query = query.group_by(key).order_by(key.desc() if group == "day" else revenue.desc()).limit(limit)
+    return db.execute(query).all()
+
+
+def _adhoc_spend(db, user_id: int):
+    booking = models.Booking
+    return db.execute(
+        select(func.count(), func.sum(booking.quantity), func.sum(booking.amount))
+        .where(booking.user_id == user_id, booking.status == "confirmed")
+    ).one()
+
+
+def _confirm_batches(batches: int, size: int) -> dict:
+    """Mean ms per confirmation batch, with and without the rollup upserts."""
+    with engine.begin() as conn:
+        conn.execute(models.Booking.__table__.insert(), [
+            {"user_id": 1 + i % 100, "event_id": 1 + i % 50, "amount": 499.0, "quantity": 1,
+             "status": "pending", "razorpay_order_id": f"bench_{i}"}
+            for i in range((batches * 2 + 1) * size)
+        ])
+    record = sales.record_sales
+    samples = {"with_rollups": [], "without_rollups": []}
+    db = SessionLocal()
+    try:
+        for b in range(batches * 2 + 1):
+            label = "with_rollups" if b % 2 else "without_rollups"
+            confirmations.sales.record_sales = record if b % 2 else (lambda *a, **k: None)
+            items = [(f"bench_{b * size + i}", f"pay_{b * size + i}") for i in range(size)]
+            t0 = time.perf_counter()
+            confirmations.apply_confirmations(db, items)
+            if b:  # the first batch only warms up
+                samples[label].append((time.perf_counter() - t0) * 1000)
+    finally:
+        confirmations.sales.record_sales = record
+        db.close()
+    return {label: round(sum(s) / len(s), 2) for label, s in samples.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=2_000_000)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bootstrap.migrate(engine)
+    seed_events(engine, args.events)
+    t0 = time.perf_counter()
+    _seed_bookings(args.bookings, args.events, args.users)
+    seed_s = time.perf_counter() - t0
+    with engine.begin() as conn:
+        t0 = time.perf_counter()
+        sales.rebuild(conn)
+        rebuild_s = time.perf_counter() - t0
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+
+    reports = {
+        "top_events_all_time": ("event", None, None),
+        "categories_in_quarter": ("category", *PERIOD),
+        "daily_in_quarter": ("day", *PERIOD),
+    }
+    rng = random.Random(3)
+    user_ids = [rng.randint(1, args.users) for _ in range(200)]
+    results = {}
+    db = SessionLocal()
+    try:
+        for name, (group, start, end) in reports.items():
+            assert len(sales.sales_report(db, group, start, end)) == len(_adhoc(db, group, start, end))
+            results[name] = {
+                "rollup": summarize(timed(lambda: sales.sales_report(db, group, start, end), args.repeat * 10)),
+                "adhoc": summarize(timed(lambda: _adhoc(db, group, start, end), args.repeat)),
+            }
+        results["user_spend_200_users"] = {
+            "rollup": summarize(timed(lambda: [sales.user_spend(db, u) for u in user_ids], args.repeat)),
+            "adhoc": summarize(timed(lambda: [_adhoc_spend(db, u) for u in user_ids], args.repeat)),
+        }
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "bookings": args.bookings,
+        "seed_s": round(seed_s, 1),
+        "rebuild_s": round(rebuild_s, 1),
+        **{name: {**r, "speedup": round(r["adhoc"]["mean_ms"] / r["rollup"]["mean_ms"], 1)} for name, r in results.items()},
+        "confirm_batch_of_200_ms": _confirm_batches(batches=10, size=200),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare GET /events search latency: indexed full-text vs the old ILIKE scan.
+
+    python -m benchmarks.search_latency --events 100000
+"""
+import argparse
+import json
+
+from benchmarks._common import configure_database, seed_events, summarize, timed
+
+configure_database()
+
+from sqlalchemy import or_  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import fulltext  # noqa: E402
+import models  # noqa: E402
+
+TERMS = ["coldplay", "jazz", "mumbai", "fest", "startup night", "biryani masterclass", "cric"]
+
+
+def ilike_query(db, search):
+    return (
+        db.query(models.Event)
+        .filter(models.Event.is_active == True)
+        .filter(or_(
+            models.Event.title.ilike(f"%{search}%"),
+            models.Event.location.ilike(f"%{search}%"),
+            models.Event.description.ilike(f"%{search}%"),
+        ))
+        .order_by(models.Event.date.asc())
+        .all()
+    )
+
+
+def fulltext_query(db, search):
+    query = db.query(models.Event).filter(models.Event.is_active == True)
+    return fulltext.apply_search(query, search).order_by(models.Event.date.asc()).all()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    models.Base.metadata.create_all(bind=engine)
+    fulltext.ensure_search_index(engine)
+    seed_events(engine, args.events)
+
+    results = {"dialect": engine.dialect.name, "events": args.events, "terms": {}}
+    db = SessionLocal()
+    try:
+        for term in TERMS:
+            results["terms"][term] = {
+                "ilike": summarize(timed(lambda: ilike_query(db, term), args.repeat)),
+                "fulltext": summarize(timed(lambda: fulltext_query(db, term), args.repeat)),
+                "matches": len(fulltext_query(db, term)),
+            }
+    finally:
+        db.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
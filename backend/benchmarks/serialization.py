@@ -0,0 +1,83 @@
+"""Compare catalog encoding paths for GET /events at 1k and 10k events.
+
+    python -m benchmarks.serialization --sizes 1000 10000
+
+  orm_jsonable:  ORM objects -> EventResponse -> jsonable_encoder -> json.dumps
+                 (what the route did before any of this work)
+  orm_adapter:   ORM objects -> TypeAdapter(list[EventResponse]).dump_json
+  projected:     column projection -> orjson (serialization.encode_events)
+"""
+import argparse
+import json
+
+from benchmarks._common import configure_database, seed_events, summarize, timed
+
+configure_database()
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+import models  # noqa: E402
+import schemas  # noqa: E402
+import serialization  # noqa: E402
+
+_adapter = TypeAdapter(list[schemas.EventResponse])
+
+
+def _query(db):
+    return db.query(models.Event).filter(models.Event.is_active == True).order_by(models.Event.date.asc())
+
+
+def orm_jsonable(db):
+    events = _query(db).all()
+    body = [schemas.EventResponse.model_validate(e) for e in events]
+    return json.dumps(jsonable_encoder(body)).encode()
+
+
+def orm_adapter(db):
+    events = _query(db).all()
+    return _adapter.dump_json(_adapter.validate_python(events, from_attributes=True))
+
+
+def projected(db):
+    rows = _query(db).with_entities(*serialization.EVENT_COLUMNS).all()
+    return serialization.dumps([row._asdict() for row in rows])
+
+
+PATHS = {"orm_jsonable": orm_jsonable, "orm_adapter": orm_adapter, "projected": projected}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if serialization.orjson is None:
+        raise SystemExit("orjson is not installed")
+    models.Base.metadata.create_all(bind=engine)
+
+    results = {"dialect": engine.dialect.name, "sizes": {}}
+    for size in args.sizes:
+        with engine.begin() as conn:
+            conn.execute(delete(models.Event))
+        seed_events(engine, size)
+
+        db = SessionLocal()
+        try:
+            bodies = {name: fn(db) for name, fn in PATHS.items()}
+            # Same rows, same JSON document, whatever the path
+            reference = json.loads(bodies["orm_jsonable"])
+            assert all(json.loads(b) == reference for b in bodies.values())
+            results["sizes"][size] = {
+                "bytes": len(bodies["projected"]),
+                **{name: summarize(timed(lambda: fn(db), args.repeat)) for name, fn in PATHS.items()},
+            }
+        finally:
+            db.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
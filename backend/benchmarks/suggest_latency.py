@@ -0,0 +1,100 @@
+"""Typeahead lookups from the in-memory index, next to the /events search they replace.
+
+    python -m benchmarks.suggest_latency --events 100000
+
+Loads the suggest index from a seeded catalog and reports the load time,
+per-keystroke lookup latency (every prefix of each term, as a user types
+it) with and without the per-prefix memo, the cost of applying one committed change, and the full-text
+/events query for the same terms. Also checks every one- and two-letter
+prefix against a catalog smaller than one scan window, where the
+bisect bounds run off the end of the index.
+"""
+import string
+import argparse
+import json
+import time
+
+from benchmarks._common import configure_database, fake_event_rows, seed_events, summarize, timed
+
+configure_database()
+
+from database import SessionLocal, engine  # noqa: E402
+import bootstrap  # noqa: E402
+import fulltext  # noqa: E402
+import models  # noqa: E402
+import suggest  # noqa: E402
+
+TERMS = ["coldplay", "jazz night", "mumbai", "festival", "startup summit", "biryani", "cricket finals"]
+
+
+def _keystrokes():
+    return [term[:n] for term in TERMS for n in range(1, len(term) + 1)]
+
+
+def _small_catalog(events: int = 22) -> dict:
+    small = suggest.SuggestIndex()
+    small.load(
+        (i, row["title"], row["location"], row["category"])
+        for i, row in enumerate(fake_event_rows(events), 1)
+    )
+    assert len(small._keys) < suggest.SUGGEST_SCAN
+    letters = string.ascii_lowercase
+    prefixes = [*letters, *(a + b for a in letters for b in letters), *_keystrokes()]
+    matched = sum(1 for prefix in prefixes if small.search(prefix))
+    return {"events": events, "index_keys": len(small._keys), "prefixes": len(prefixes), "matched": matched}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    bootstrap.migrate(engine)
+    seed_events(engine, args.events)
+
+    t0 = time.perf_counter()
+    suggest.reload()
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    lookups = {"uncached": [], "cached": []}
+    for _ in range(args.repeat):
+        for prefix in _keystrokes():
+            suggest.index._results.clear()
+            for label in ("uncached", "cached"):
+                t0 = time.perf_counter()
+                suggest.index.search(prefix)
+                lookups[label].append((time.perf_counter() - t0) * 1000)
+
+    changes = [{-i: (f"Benchmark Night {i}", "Venue 1, Pune", "Music")} for i in range(1, 201)]
+    t0 = time.perf_counter()
+    for change in changes:
+        suggest.index.apply(change)
+    apply_ms = (time.perf_counter() - t0) * 1000 / len(changes)
+
+    db = SessionLocal()
+    try:
+        def full_search():
+            for term in TERMS:
+                query = db.query(models.Event).filter(models.Event.is_active == True)
+                fulltext.apply_search(query, term).order_by(models.Event.date.asc()).limit(20).all()
+
+        search = [sample / len(TERMS) for sample in timed(full_search, max(1, args.repeat // 20))]
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "events": args.events,
+        "index_keys": len(suggest.index._keys),
+        "load_ms": round(load_ms, 1),
+        "suggest_uncached": summarize(lookups["uncached"]),
+        "suggest_cached": summarize(lookups["cached"]),
+        "apply_change_ms": round(apply_ms, 3),
+        "events_search": summarize(search),
+        "small_catalog": _small_catalog(),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
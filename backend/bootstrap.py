@@ -0,0 +1,108 @@
+import hashlib
+import os
+from sqlalchemy import inspect, literal, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex, CreateTable
+import fulltext
+import models
+import sales
+
+# ─────────────────────────────────────────────
+# Schema bootstrap
+#
+# SCHEMA_CHECK=fingerprint  compare a hash of the expected schema with the
+#                           one stored in schema_meta (a single SELECT) and
+#                           only create/upgrade on mismatch. Default.
+# SCHEMA_CHECK=skip         trust the database; no queries on cold start.
+#                           Only for deployments that run
+#                           `python manage.py init-db` themselves.
+# SCHEMA_CHECK=full         always run the create/upgrade steps.
+#
+# Upgrading only adds what is missing: tables, columns and indexes.
+# Bump SCHEMA_VERSION to force it when nothing in the DDL changed.
+# After creating or upgrading at startup, an empty catalog gets the demo
+# events (SEED_DEMO_EVENTS=0 turns that off).
+# ─────────────────────────────────────────────
+SCHEMA_VERSION = 1
+SCHEMA_CHECK = os.getenv("SCHEMA_CHECK", "fingerprint").lower()
+SEED_DEMO_EVENTS = os.getenv("SEED_DEMO_EVENTS", "1") == "1"
+
+
+def schema_fingerprint(dialect) -> str:
+    parts = [f"version:{SCHEMA_VERSION}"]
+    for table in models.Base.metadata.sorted_tables:
+        parts.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            parts.append(str(CreateIndex(index).compile(dialect=dialect)))
+    if dialect.name == "postgresql":
+        parts.extend(fulltext.PG_DDL)
+    elif dialect.name == "sqlite":
+        parts.extend(fulltext.SQLITE_DDL)
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _stored_fingerprint(engine):
+    try:
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT fingerprint FROM schema_meta WHERE id = 1")).scalar()
+    except DBAPIError:
+        return None  # no schema_meta yet
+
+
+def _add_missing_columns(conn):
+    inspector = inspect(conn)
+    for table in models.Base.metadata.sorted_tables:
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=conn.dialect)}"
+            default = column.default.arg if column.default is not None and column.default.is_scalar else None
+            if default is not None:
+                value = literal(default, column.type).compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+                ddl += f" DEFAULT {value}"
+                if not column.nullable:
+                    ddl += " NOT NULL"
+            conn.execute(text(ddl))
+            print(f"Added column {table.name}.{column.name}")
+
+
+def migrate(engine):
+    fingerprint = schema_fingerprint(engine.dialect)
+    had_rollups = inspect(engine).has_table(models.EventSales.__tablename__)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        _add_missing_columns(conn)
+        for table in models.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                # IF NOT EXISTS: reflection can't see expression indexes on SQLite
+                conn.execute(CreateIndex(index, if_not_exists=True))
+    fulltext.ensure_search_index(engine)
+    if not had_rollups:
+        # Backfill sales from the bookings confirmed before the rollups existed
+        with engine.begin() as conn:
+            sales.rebuild(conn)
+    with engine.begin() as conn:
+        conn.execute(models.SchemaMeta.__table__.delete())
+        conn.execute(models.SchemaMeta.__table__.insert().values(id=1, fingerprint=fingerprint))
+
+
+def ensure_schema(engine, mode: str = SCHEMA_CHECK) -> bool:
+    """Returns True when it created or upgraded the schema."""
+    if mode == "skip":
+        return False
+    if mode == "fingerprint" and _stored_fingerprint(engine) == schema_fingerprint(engine.dialect):
+        return False
+    migrate(engine)
+    return True
+
+
+def seed_demo_events():
+    from database import SessionLocal
+    from seed import seed_events
+
+    db = SessionLocal()
+    try:
+        seed_events(db)
+    finally:
+        db.close()
@@ -0,0 +1,178 @@
+import csv
+import io
+import os
+import tempfile
+import time
+import orjson
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.dialects import postgresql, sqlite
+import cache
+import models
+import schemas
+import suggest
+
+# ─────────────────────────────────────────────
+# Bulk event import
+#
+# Streams CSV or NDJSON, validates IMPORT_BATCH_SIZE rows per TypeAdapter
+# call and writes each batch as one executemany
+# INSERT ... ON CONFLICT (title, location, date) DO UPDATE. Memory stays at
+# one batch whatever the file size. psycopg2 sends executemany INSERTs as
+# multi-row VALUES pages, so Postgres gets a few statements per batch.
+#
+# Re-importing an event updates its details but keeps available_seats:
+# the live count already reflects bookings, the partner's figure doesn't.
+#
+# One transaction per import: a file rejected halfway leaves the catalog
+# as it was. Invalid rows are skipped and reported, up to max_errors.
+# ─────────────────────────────────────────────
+IMPORT_TOKEN = os.getenv("IMPORT_TOKEN")  # unset: no HTTP endpoint, CLI only
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 2000))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 100))
+IMPORT_MAX_BYTES = int(os.getenv("IMPORT_MAX_BYTES", 100 * 1024 * 1024))
+IMPORT_SPOOL_MEMORY = 8 * 1024 * 1024  # request bodies beyond this go to a temp file
+
+NATURAL_KEY = ("title", "location", "date")
+_UPDATE_COLUMNS = ("description", "price", "category", "image_url", "is_active")
+_ERROR_SAMPLES = 20
+
+_rows_adapter = TypeAdapter(list[schemas.EventImportRow])
+
+
+# ─────────────────────────────────────────────
+# Readers: yield (line number, raw row)
+# ─────────────────────────────────────────────
+def _read_csv(stream):
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    for row in reader:
+        # Empty cells are missing values, not empty strings
+        yield reader.line_num, {k: v for k, v in row.items() if k is not None and v not in (None, "")}
+
+
+def _read_ndjson(stream):
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield line_no, None  # rejected by validation like any other bad row
+
+
+_READERS = {"csv": _read_csv, "ndjson": _read_ndjson}
+
+
+def detect_format(hint: str) -> str:
+    """Format from an explicit name, a file name or a Content-Type."""
+    hint = (hint or "").lower()
+    if hint == "csv" or hint.endswith(".csv") or "text/csv" in hint:
+        return "csv"
+    if hint in ("ndjson", "jsonl") or hint.endswith((".ndjson", ".jsonl")) or "ndjson" in hint or "jsonl" in hint:
+        return "ndjson"
+    raise HTTPException(status_code=415, detail="Import expects CSV or NDJSON")
+
+
+# ─────────────────────────────────────────────
+# Batches
+# ─────────────────────────────────────────────
+def _upsert_statement(dialect: str):
+    if dialect == "postgresql":
+        insert = postgresql.insert
+    elif dialect == "sqlite":
+        insert = sqlite.insert
+    else:
+        raise HTTPException(status_code=501, detail=f"Bulk import is not supported on {dialect}")
+    table = models.Event.__table__
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c[name] for name in NATURAL_KEY],
+        set_={name: stmt.excluded[name] for name in _UPDATE_COLUMNS},
+    )
+
+
+def _validate(batch, errors: list) -> list:
+    rows = [row for _, row in batch]
+    try:
+        return _rows_adapter.validate_python(rows)
+    except ValidationError as exc:
+        bad = {}
+        for err in exc.errors(include_url=False):
+            index, field = err["loc"][0], ".".join(str(part) for part in err["loc"][1:])
+            bad.setdefault(index, f"line {batch[index][0]}: {field + ': ' if field else ''}{err['msg']}")
+        errors.extend(bad.values())
+        return _rows_adapter.validate_python([row for i, row in enumerate(rows) if i not in bad])
+
+
+def _write(conn, statement, rows) -> int:
+    # Later rows win: one multi-row ON CONFLICT statement can't touch a key twice
+    distinct = {}
+    for row in rows:
+        values = row.model_dump()
+        distinct[tuple(values[name] for name in NATURAL_KEY)] = values
+    if distinct:
+        conn.execute(statement, list(distinct.values()))
+    return len(distinct)
+
+
+def import_events(conn, stream, fmt: str, batch_size: int = IMPORT_BATCH_SIZE, max_errors: int = IMPORT_MAX_ERRORS) -> dict:
+    """Upsert events from a binary `stream` on `conn`; the caller owns the transaction."""
+    started = time.perf_counter()
+    statement = _upsert_statement(conn.dialect.name)
+    errors = []
+    read = written = 0
+
+    def flush(batch):
+        nonlocal written
+        valid = _validate(batch, errors)
+        if len(errors) > max_errors:
+            raise HTTPException(
+                status_code=422,
+                detail={"message": f"More than {max_errors} invalid rows, nothing imported", "errors": errors[:_ERROR_SAMPLES]},
+            )
+        written += _write(conn, statement, valid)
+
+    batch = []
+    for line_no, row in _READERS[fmt](stream):
+        read += 1
+        batch.append((line_no, row))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    seconds = time.perf_counter() - started
+    return {
+        "rows_read": read,
+        "rows_written": written,
+        "rows_invalid": len(errors),
+        "errors": errors[:_ERROR_SAMPLES],
+        "seconds": round(seconds, 3),
+        "rows_per_sec": round(read / seconds, 1) if seconds else 0.0,
+    }
+
+
+def run_import(stream, fmt: str, **options) -> dict:
+    from database import engine
+
+    with engine.begin() as conn:
+        result = import_events(conn, stream, fmt, **options)
+    # Core writes skip the Session hooks in cache.py and suggest.py
+    cache.invalidate_catalog()
+    suggest.index.expire()
+    return result
+
+
+async def spool_body(chunks, max_bytes: int = IMPORT_MAX_BYTES):
+    """Buffer a streamed request body, in memory up to a point, then on disk."""
+    spool = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY)
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > max_bytes:
+            spool.close()
+            raise HTTPException(status_code=413, detail=f"Import body is larger than {max_bytes} bytes")
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
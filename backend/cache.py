@@ -0,0 +1,132 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import models
+
+# ─────────────────────────────────────────────
+# In-process TTL + LRU cache for catalog responses
+#
+# Entries are dropped when any Event row is inserted, updated or deleted
+# through a Session (including bulk UPDATEs such as seat decrements).
+# Core-level writes outside a Session must call invalidate_catalog().
+# Seat-count UPDATEs carry execution_options(seats_only=True): they drop
+# entries too, but don't count as catalog writes for replica routing.
+# ─────────────────────────────────────────────
+EVENTS_CACHE_SIZE = int(os.getenv("EVENTS_CACHE_SIZE", 256))
+EVENTS_CACHE_TTL = float(os.getenv("EVENTS_CACHE_TTL", 60))
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation: int = None, ttl: float = None):
+        # A reader that started before an invalidation must not repopulate
+        # the cache with what it read.
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self.generation += 1
+            item = self._data.pop(key, None)
+            return None if item is None else item[1]
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+catalog_cache = TTLCache(EVENTS_CACHE_SIZE, EVENTS_CACHE_TTL)
+catalog_written_at = 0.0  # time.monotonic() of the last catalog write, seat counts aside
+
+
+def invalidate_catalog(seats_only: bool = False):
+    global catalog_written_at
+    if not seats_only:
+        catalog_written_at = time.monotonic()
+    catalog_cache.clear()
+
+
+# ─────────────────────────────────────────────
+# ETag helpers
+# ─────────────────────────────────────────────
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+# ─────────────────────────────────────────────
+# Invalidation hooks
+# ─────────────────────────────────────────────
+_CHANGED_KEY = "events_changed"
+
+
+# session.info[_CHANGED_KEY]: True after a catalog write, False after
+# seat-count changes only
+@event.listens_for(Session, "after_flush")
+def _track_event_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, models.Event):
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_event_changes(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        if any(m.class_ is models.Event for m in orm_execute_state.all_mappers):
+            info = orm_execute_state.session.info
+            if orm_execute_state.execution_options.get("seats_only"):
+                info.setdefault(_CHANGED_KEY, False)
+            else:
+                info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed is not None:
+        invalidate_catalog(seats_only=not changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop(_CHANGED_KEY, None)
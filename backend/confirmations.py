@@ -0,0 +1,196 @@
+import asyncio
+import os
+from collections import Counter
+from fastapi import HTTPException
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from cache import TTLCache
+from database import SessionLocal
+import models
+import reservations
+import sales
+
+# ─────────────────────────────────────────────
+# Payment confirmation pipeline
+#
+# Verified confirmations (client callbacks and gateway webhooks) are
+# queued and a single background worker applies them in batches: one
+# UPDATE ... WHERE razorpay_order_id IN (...) AND status = 'pending'
+# confirms the whole batch in one transaction, together with the sales
+# rollups it adds to (sales.py). Clients poll or long-poll the booking
+# status.
+#
+# With CONFIRM_PIPELINE=0, or when the worker isn't running (e.g. a
+# serverless function without lifespan events), each confirmation is
+# applied inline as a batch of one.
+# ─────────────────────────────────────────────
+CONFIRM_PIPELINE = os.getenv("CONFIRM_PIPELINE", "1") == "1"
+CONFIRM_BATCH_SIZE = int(os.getenv("CONFIRM_BATCH_SIZE", 200))
+CONFIRM_BATCH_WINDOW_MS = float(os.getenv("CONFIRM_BATCH_WINDOW_MS", 20))
+CONFIRM_QUEUE_SIZE = int(os.getenv("CONFIRM_QUEUE_SIZE", 10000))
+CONFIRM_MAX_ATTEMPTS = 3
+
+
+def apply_confirmations(db: Session, items: list) -> dict:
+    """Confirm [(order_id, payment_id), ...]; returns {order_id: (booking_id, user_id, status)}."""
+    payment_ids = dict(items)
+    order_ids = list(payment_ids)
+    results = {}
+
+    confirmed = db.execute(
+        update(models.Booking)
+        .where(models.Booking.razorpay_order_id.in_(order_ids), models.Booking.status == "pending")
+        .values(
+            status="confirmed",
+            hold_expires_at=None,
+            razorpay_payment_id=case(payment_ids, value=models.Booking.razorpay_order_id),
+        )
+        .returning(
+            models.Booking.id, models.Booking.user_id, models.Booking.razorpay_order_id,
+            models.Booking.event_id, models.Booking.quantity, models.Booking.amount, models.Booking.booked_at,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    for row in confirmed:
+        results[row.razorpay_order_id] = (row.id, row.user_id, "confirmed")
+    sales.record_sales(db, confirmed)
+
+    leftover = [order_id for order_id in order_ids if order_id not in results]
+    if leftover:
+        rows = db.execute(
+            select(
+                models.Booking.id, models.Booking.user_id, models.Booking.razorpay_order_id,
+                models.Booking.status, models.Booking.event_id, models.Booking.quantity,
+                models.Booking.amount, models.Booking.booked_at,
+            ).where(models.Booking.razorpay_order_id.in_(leftover))
+        ).all()
+        for row in rows:
+            status = row.status
+            if status in ("expired", "cancelled"):
+                status = _confirm_lapsed(db, row, payment_ids[row.razorpay_order_id])
+            results[row.razorpay_order_id] = (row.id, row.user_id, status)
+
+    db.commit()
+    return results
+
+
+def _confirm_lapsed(db: Session, row, payment_id: str) -> str:
+    # Paid after the hold lapsed: take the seats again if any are left,
+    # otherwise the payment has to be refunded.
+    got_seats = reservations.take_seats(db, row.event_id, row.quantity) is not None
+    status = "confirmed" if got_seats else "refund_pending"
+    updated = db.execute(
+        update(models.Booking)
+        .where(models.Booking.id == row.id, models.Booking.status == row.status)
+        .values(status=status, razorpay_payment_id=payment_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if got_seats and not updated:
+        reservations.return_seats(db, Counter({row.event_id: row.quantity}))
+    elif got_seats:
+        sales.record_sales(db, [row])
+    return status
+
+
+def _apply_batch(items: list) -> dict:
+    db = SessionLocal()
+    try:
+        return apply_confirmations(db, items)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class ConfirmationPipeline:
+    def __init__(self):
+        self.queue = None
+        self.recent = TTLCache(50000, 600)  # booking_id -> (user_id, status)
+        self._batch_done = None
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        self.queue = asyncio.Queue(maxsize=CONFIRM_QUEUE_SIZE)
+        self._batch_done = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def submit(self, order_id: str, payment_id: str, booking_id: int = None, user_id: int = None):
+        if not (CONFIRM_PIPELINE and self.running):
+            self._record(await run_in_threadpool(_apply_batch, [(order_id, payment_id)]))
+            return
+        try:
+            self.queue.put_nowait((order_id, payment_id))
+        except asyncio.QueueFull:
+            raise HTTPException(
+                status_code=503,
+                detail="Too many pending confirmations, please retry",
+                headers={"Retry-After": "1"},
+            )
+        if booking_id is not None:
+            # Pollers see "pending" until the worker has applied it, even if
+            # the booking row itself already reads expired.
+            self.recent.set(booking_id, (user_id, "pending"))
+
+    def recent_status(self, booking_id: int, user_id: int):
+        entry = self.recent.get(booking_id)
+        if entry is None or entry[0] != user_id:
+            return None
+        return entry[1]
+
+    async def wait_for_batch(self, timeout: float):
+        if self._batch_done is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(self._batch_done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _record(self, results: dict):
+        for booking_id, user_id, status in results.values():
+            self.recent.set(booking_id, (user_id, status))
+
+    async def _next_batch(self) -> list:
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + CONFIRM_BATCH_WINDOW_MS / 1000
+        while len(batch) < CONFIRM_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            for attempt in range(1, CONFIRM_MAX_ATTEMPTS + 1):
+                try:
+                    self._record(await run_in_threadpool(_apply_batch, batch))
+                    break
+                except Exception as e:
+                    print(f"Confirmation batch failed (attempt {attempt}):", e)
+                    if attempt == CONFIRM_MAX_ATTEMPTS:
+                        # Webhooks are redelivered by the gateway; log what was dropped
+                        print("Dropped confirmations:", [order_id for order_id, _ in batch])
+                    else:
+                        await asyncio.sleep(attempt)
+            done, self._batch_done = self._batch_done, asyncio.Event()
+            done.set()
+
+
+pipeline = ConfirmationPipeline()
@@ -1,14 +1,57 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Optional read replica for read-only routes (the catalog). Unset: everything uses the primary.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,      # prevents stale connections
-    pool_recycle=300         # helps in serverless
-)
+# "sync" runs route DB work on the threadpool, "async" on an asyncio driver
+# (asyncpg for Postgres, aiosqlite for SQLite).
+DB_MODE = os.getenv("DB_MODE", "sync").lower()
+
+# ─────────────────────────────────────────────
+# Pool profiles
+#
+# serverless  NullPool: each invocation opens its own connection and the
+#             external pooler (Neon's -pooler host / PgBouncer) does the
+#             pooling. Default on Vercel.
+# container   long-lived QueuePool sized by DB_POOL_SIZE/DB_MAX_OVERFLOW.
+#             No pre-ping round trip per checkout: a dead connection fails
+#             one statement, SQLAlchemy then invalidates the whole pool and
+#             reconnects. LIFO reuse keeps the idle tail small so server-side
+#             idle timeouts rarely hit a connection we hand out.
+#             DB_POOL_PRE_PING=1 turns pre-ping back on.
+# ─────────────────────────────────────────────
+DB_POOL_PROFILE = os.getenv("DB_POOL_PROFILE", "serverless" if os.getenv("VERCEL") else "container").lower()
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 300))  # below Neon's idle suspend
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "0") == "1"
+
+
+def _pool_options(url) -> dict:
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}  # in-memory SQLite needs its single-connection pool
+    if DB_POOL_PROFILE == "serverless":
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_use_lifo": True,
+    }
+
+
+# The sync engine always exists: startup, streaming responses and scripts use it.
+engine = create_engine(DATABASE_URL, **_pool_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -16,11 +59,120 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+read_engine = create_engine(DATABASE_READ_URL, **_pool_options(DATABASE_READ_URL)) if DATABASE_READ_URL else engine
+
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine
+) if DATABASE_READ_URL else SessionLocal
+
 Base = declarative_base()
 
+
+def _async_url(url: str):
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    if url.get_backend_name() == "postgresql":
+        # asyncpg spells libpq's sslmode as ssl and has no channel_binding
+        query = dict(url.query)
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        query.pop("channel_binding", None)
+        return url.set(drivername="postgresql+asyncpg", query=query)
+    return url
+
+
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+
+if DB_MODE == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(_async_url(DATABASE_URL), **_pool_options(DATABASE_URL))
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+    async_read_engine, AsyncReadSessionLocal = async_engine, AsyncSessionLocal
+    if DATABASE_READ_URL:
+        async_read_engine = create_async_engine(_async_url(DATABASE_READ_URL), **_pool_options(DATABASE_READ_URL))
+        AsyncReadSessionLocal = async_sessionmaker(
+            async_read_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def _session(async_factory, sync_factory):
+    if async_factory is not None:
+        async with async_factory() as db:
+            yield db
+    else:
+        db = sync_factory()
+        try:
+            yield db
+        finally:
+            # Closed inline: waiting for a threadpool slot here can deadlock
+            # once every slot is blocked on a pool checkout.
+            db.close()
+
+
+async def get_session():
+    """Route dependency: an AsyncSession in async mode, else a sync Session."""
+    async for db in _session(AsyncSessionLocal, SessionLocal):
+        yield db
+
+
+async def get_read_session():
+    """Like get_session, on the read replica when DATABASE_READ_URL is set.
+
+    Only for routes that never write and can tolerate replica lag."""
+    async for db in _session(AsyncReadSessionLocal, ReadSessionLocal):
+        yield db
+
+
+async def run_db(db, fn, *args, **kwargs):
+    """Run `fn(session, *args)` without blocking the event loop.
+
+    Route logic is written once against the sync Session API; in async mode
+    it runs through AsyncSession.run_sync, otherwise on the threadpool.
+    """
+    if AsyncSessionLocal is not None:
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+
+def pool_stats() -> dict:
+    """Checked-out / idle / overflow connections per pool, for metrics and debugging."""
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+    if async_engine is not None:
+        engines["primary_async"] = async_engine.sync_engine
+        if async_read_engine is not async_engine:
+            engines["replica_async"] = async_read_engine.sync_engine
+
+    stats = {}
+    for name, eng in engines.items():
+        pool = eng.pool
+        stats[name] = {
+            "pool": type(pool).__name__,
+            "size": pool.size() if hasattr(pool, "size") else 0,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+            "idle": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+        }
+    return stats
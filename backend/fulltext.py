@@ -0,0 +1,100 @@
+import re
+from sqlalchemy import Integer, func, literal_column, or_, text
+from sqlalchemy.sql import column, table
+import models
+
+# ─────────────────────────────────────────────
+# Full-text search over the event catalog
+#
+# Postgres: GIN index on a weighted tsvector expression (title > location >
+#           description). Postgres maintains it on every insert/update.
+# SQLite:   external-content FTS5 table kept in sync by triggers.
+# Anything else falls back to the old ILIKE scan.
+# ─────────────────────────────────────────────
+
+# The query below must use exactly this expression, otherwise the planner
+# will not pick up the expression index.
+PG_SEARCH_VECTOR = (
+    "(setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A'::\"char\") || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(location, '')), 'B'::\"char\") || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C'::\"char\"))"
+)
+
+PG_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_events_search ON events USING GIN ({PG_SEARCH_VECTOR})",
+]
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        title, location, description,
+        content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, title, location, description)
+        VALUES (new.id, new.title, new.location, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, location, description)
+        VALUES ('delete', old.id, old.title, old.location, old.description);
+    END""",
+    # Only text edits touch the index; seat-count updates skip it entirely.
+    """CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF title, location, description ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, location, description)
+        VALUES ('delete', old.id, old.title, old.location, old.description);
+        INSERT INTO events_fts(rowid, title, location, description)
+        VALUES (new.id, new.title, new.location, new.description);
+    END""",
+]
+
+events_fts = table("events_fts", column("rowid", Integer), column("events_fts"))
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ensure_search_index(engine):
+    dialect = engine.dialect.name
+    with engine.begin() as conn:
+        if dialect == "postgresql":
+            for ddl in PG_DDL:
+                conn.execute(text(ddl))
+        elif dialect == "sqlite":
+            existed = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'")
+            ).first()
+            for ddl in SQLITE_DDL:
+                conn.execute(text(ddl))
+            if not existed:
+                # Backfill rows that were inserted before the triggers existed
+                conn.execute(text("INSERT INTO events_fts(events_fts) VALUES ('rebuild')"))
+
+
+def _tokens(search: str) -> list[str]:
+    return [t.lower() for t in _TOKEN_RE.findall(search)]
+
+
+def apply_search(query, search: str, ranked: bool = True):
+    """Filter an Event query by `search`, most relevant matches first unless
+    `ranked` is False (keyset pages need a stable (date, id) order)."""
+    dialect = query.session.get_bind().dialect.name
+    tokens = _tokens(search)
+
+    if tokens and dialect == "postgresql":
+        vector = literal_column(PG_SEARCH_VECTOR)
+        tsquery = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in tokens))
+        query = query.filter(vector.op("@@")(tsquery))
+        return query.order_by(func.ts_rank(vector, tsquery).desc()) if ranked else query
+
+    if tokens and dialect == "sqlite":
+        match = " ".join(f'"{t}"*' for t in tokens)
+        query = (
+            query.join(events_fts, events_fts.c.rowid == models.Event.id)
+            .filter(events_fts.c.events_fts.match(match))
+        )
+        return query.order_by(func.bm25(literal_column("events_fts"), 10.0, 5.0, 1.0)) if ranked else query
+
+    return query.filter(or_(
+        models.Event.title.ilike(f"%{search}%"),
+        models.Event.location.ilike(f"%{search}%"),
+        models.Event.description.ilike(f"%{search}%"),
+    ))
@@ -1,23 +1,49 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from starlette.concurrency import run_in_threadpool
+from datetime import date
+import asyncio
+import json
 import os
-from database import engine, get_db
+import secrets
+import time
+from auth import create_access_token, decode_token, get_current_user, security
+from database import (
+    ReadSessionLocal, SessionLocal, async_engine, async_read_engine, engine,
+    get_read_session, get_session, read_engine, run_db,
+)
 import models
 import schemas
+import bootstrap
+import bulk_import
+import cache
+import confirmations
+import passwords
+import fulltext
+import metrics
+import pagination
+import payments
+import ratelimit
+import reservations
+import sales
+import seatfeed
+import serialization
+import suggest
 
 # ─────────────────────────────────────────────
 # App Initialization
 # ─────────────────────────────────────────────
 app = FastAPI(title="Event Booking API")
 
-# Create tables on startup (VERY IMPORTANT for Neon)
-models.Base.metadata.create_all(bind=engine)
+# Make sure the tables exist (VERY IMPORTANT for Neon). Costs one query,
+# or none with SCHEMA_CHECK=skip; see bootstrap.py.
+if bootstrap.ensure_schema(engine) and bootstrap.SEED_DEMO_EVENTS:
+    bootstrap.seed_demo_events()
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,309 +51,56 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[pagination.NEXT_CURSOR_HEADER, "ETag"],
 )
 
+if metrics.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+    for _engine in {engine, read_engine}:
+        metrics.instrument_engine(_engine)
+    for _engine in {async_engine, async_read_engine} - {None}:
+        metrics.instrument_engine(_engine.sync_engine)
+
 # ─────────────────────────────────────────────
 # ENV VARIABLES
 # ─────────────────────────────────────────────
-SECRET_KEY = os.getenv("SECRET_KEY", "fallback_secret")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", 500))
+LONG_POLL_RECHECK = float(os.getenv("LONG_POLL_RECHECK", 1))
+CONFIRM_TEST_WAIT = float(os.getenv("CONFIRM_TEST_WAIT", 10))
+# After a catalog write, read the catalog from the primary for this long
+REPLICA_LAG_WINDOW = float(os.getenv("REPLICA_LAG_WINDOW", 5))
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-security = HTTPBearer()
 
-# ─────────────────────────────────────────────
-# Helper Functions
-# ─────────────────────────────────────────────
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+_background_tasks = []
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
 
-def create_access_token(data: dict) -> str:
-    to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-
-# ─────────────────────────────────────────────
-# Seed Initial Events
-# ─────────────────────────────────────────────
-def seed_events(db: Session):
-    count = db.query(models.Event).count()
-    if count > 0:
-        return
-
-    events = [
-        # ── Music ──────────────────────────────
-        models.Event(
-            title="Coldplay India Tour 2025",
-            description="Experience the magic of Coldplay live in Mumbai! A night filled with dazzling lights, confetti, and timeless hits from one of the world's biggest bands.",
-            location="DY Patil Stadium, Mumbai",
-            date=datetime(2025, 1, 19, 19, 0),
-            price=4999,
-            category="Music",
-            available_seats=50000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Arijit Singh Live Concert",
-            description="The soulful voice of Bollywood, Arijit Singh, performs his greatest hits live in Delhi. An unforgettable evening of emotion and music.",
-            location="Jawaharlal Nehru Stadium, Delhi",
-            date=datetime(2025, 3, 15, 18, 30),
-            price=2499,
-            category="Music",
-            available_seats=35000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Sunburn Festival 2025",
-            description="Asia's biggest electronic music festival returns to Goa! Featuring world-class DJs, stunning visuals, and three days of non-stop music.",
-            location="Vagator Beach, Goa",
-            date=datetime(2025, 4, 27, 16, 0),
-            price=3999,
-            category="Music",
-            available_seats=20000,
-            is_active=True,
-        ),
-        models.Event(
-            title="AR Rahman Symphony Night",
-            description="An orchestral celebration of AR Rahman's legendary compositions. Experience Oscar-winning music performed live with a 100-piece orchestra.",
-            location="Nehru Indoor Stadium, Chennai",
-            date=datetime(2025, 5, 10, 19, 0),
-            price=1999,
-            category="Music",
-            available_seats=8000,
-            is_active=True,
-        ),
-
-        # ── Tech ───────────────────────────────
-        models.Event(
-            title="TechSpark India 2025",
-            description="India's premier tech conference featuring keynotes from global tech leaders, hands-on AI/ML workshops, and a massive startup expo.",
-            location="Bangalore International Exhibition Centre, Bengaluru",
-            date=datetime(2025, 2, 20, 9, 0),
-            price=1499,
-            category="Tech",
-            available_seats=5000,
-            is_active=True,
-        ),
-        models.Event(
-            title="AI & Machine Learning Summit",
-            description="Deep dive into the future of AI with industry experts. Covers generative AI, LLMs, computer vision, and real-world deployment strategies.",
-            location="Hyderabad International Convention Centre, Hyderabad",
-            date=datetime(2025, 3, 8, 9, 30),
-            price=2999,
-            category="Tech",
-            available_seats=2000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Startup Pitch Night Bengaluru",
-            description="Watch 20 promising startups pitch to top VCs and angel investors. Network with founders, mentors, and the broader startup ecosystem.",
-            location="91springboard, Bengaluru",
-            date=datetime(2025, 2, 28, 18, 0),
-            price=0,
-            category="Tech",
-            available_seats=300,
-            is_active=True,
-        ),
-        models.Event(
-            title="DevFest Mumbai 2025",
-            description="Google Developer Groups presents DevFest Mumbai — a full day of talks on Flutter, Firebase, Cloud, and Android by Google Developer Experts.",
-            location="NSCI Dome, Mumbai",
-            date=datetime(2025, 4, 5, 10, 0),
-            price=499,
-            category="Tech",
-            available_seats=1500,
-            is_active=True,
-        ),
-
-        # ── Sports ─────────────────────────────
-        models.Event(
-            title="IPL 2025: MI vs CSK",
-            description="The most anticipated rivalry in cricket returns! Mumbai Indians take on Chennai Super Kings in a blockbuster IPL clash.",
-            location="Wankhede Stadium, Mumbai",
-            date=datetime(2025, 4, 12, 19, 30),
-            price=1200,
-            category="Sports",
-            available_seats=33000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Pro Kabaddi League Finals",
-            description="The grand finale of Pro Kabaddi League Season 11. Two titans of Kabaddi battle it out for the ultimate glory.",
-            location="EKA Arena, Ahmedabad",
-            date=datetime(2025, 3, 22, 20, 0),
-            price=799,
-            category="Sports",
-            available_seats=10000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Bengaluru FC vs Mumbai City FC",
-            description="ISL Super Derby! Bengaluru FC hosts Mumbai City FC in a high-octane clash that promises edge-of-the-seat football action.",
-            location="Sree Kanteerava Stadium, Bengaluru",
-            date=datetime(2025, 2, 16, 19, 0),
-            price=399,
-            category="Sports",
-            available_seats=22000,
-            is_active=True,
-        ),
-
-        # ── Food ───────────────────────────────
-        models.Event(
-            title="India Food & Wine Festival",
-            description="Celebrate the finest flavours of India and the world. 100+ food stalls, master chef demos, wine tastings, and culinary workshops.",
-            location="MMRDA Grounds, Bandra Kurla Complex, Mumbai",
-            date=datetime(2025, 3, 1, 11, 0),
-            price=599,
-            category="Food",
-            available_seats=15000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Street Food Festival Bengaluru",
-            description="A three-day celebration of India's iconic street food! Over 50 vendors from across the country — chaat, dosas, rolls, desserts, and more.",
-            location="Palace Grounds, Bengaluru",
-            date=datetime(2025, 4, 18, 12, 0),
-            price=0,
-            category="Food",
-            available_seats=25000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Masterclass: The Art of Biryani",
-            description="Learn the secrets of authentic Hyderabadi Dum Biryani from award-winning chef Imtiaz Qureshi. Includes a hands-on cooking session and full meal.",
-            location="ITC Kohenur, Hyderabad",
-            date=datetime(2025, 3, 30, 14, 0),
-            price=3499,
-            category="Food",
-            available_seats=50,
-            is_active=True,
-        ),
-
-        # ── Art ────────────────────────────────
-        models.Event(
-            title="Kochi-Muziris Biennale 2025",
-            description="South Asia's largest contemporary art exhibition returns to the historic shores of Kochi, featuring 100+ artists from 30 countries.",
-            location="Aspinwall House, Kochi",
-            date=datetime(2025, 2, 12, 10, 0),
-            price=100,
-            category="Art",
-            available_seats=5000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Delhi Art Week",
-            description="A curated week of gallery openings, artist talks, live installations, and workshops celebrating contemporary Indian and global art.",
-            location="Lodhi Art District, New Delhi",
-            date=datetime(2025, 3, 17, 10, 0),
-            price=0,
-            category="Art",
-            available_seats=3000,
-            is_active=True,
-        ),
-
-        # ── Comedy ─────────────────────────────
-        models.Event(
-            title="Zakir Khan Live: Sakht Launda Tour",
-            description="India's most beloved stand-up comedian Zakir Khan is back with a brand new hour of honest, heartwarming, and hilarious storytelling.",
-            location="Siri Fort Auditorium, New Delhi",
-            date=datetime(2025, 3, 5, 19, 30),
-            price=999,
-            category="Comedy",
-            available_seats=1800,
-            is_active=True,
-        ),
-        models.Event(
-            title="The Comedy Store Mumbai: Open Mic Night",
-            description="Catch the next big voices in Indian comedy! 12 fresh comedians take the stage for a wild night of laughs at Mumbai's iconic comedy club.",
-            location="The Comedy Store, Lower Parel, Mumbai",
-            date=datetime(2025, 2, 22, 20, 0),
-            price=299,
-            category="Comedy",
-            available_seats=200,
-            is_active=True,
-        ),
-        models.Event(
-            title="Kenny Sebastian: New Special Live",
-            description="Kenny Sebastian brings his new stand-up special to Bengaluru before it drops online. Expect relatable stories, live music, and non-stop laughs.",
-            location="Chowdaiah Memorial Hall, Bengaluru",
-            date=datetime(2025, 4, 20, 19, 0),
-            price=799,
-            category="Comedy",
-            available_seats=1200,
-            is_active=True,
-        ),
-
-        # ── Business ───────────────────────────
-        models.Event(
-            title="TiE Global Summit 2025",
-            description="The world's largest entrepreneurship conference comes to India. Featuring 200+ speakers, 3000+ attendees, and unparalleled networking opportunities.",
-            location="Sheraton Grand, Bengaluru",
-            date=datetime(2025, 5, 22, 9, 0),
-            price=9999,
-            category="Business",
-            available_seats=3000,
-            is_active=True,
-        ),
-        models.Event(
-            title="Women in Leadership Summit",
-            description="An inspiring full-day summit celebrating and empowering women leaders across industries with keynotes, panel discussions, and mentoring circles.",
-            location="Taj Lands End, Mumbai",
-            date=datetime(2025, 3, 8, 9, 0),
-            price=1999,
-            category="Business",
-            available_seats=800,
-            is_active=True,
-        ),
-        models.Event(
-            title="Digital Marketing Masterclass",
-            description="A hands-on full-day workshop covering SEO, performance marketing, social media strategy, and growth hacking for startups and SMEs.",
-            location="91springboard, Koramangala, Bengaluru",
-            date=datetime(2025, 3, 25, 10, 0),
-            price=2499,
-            category="Business",
-            available_seats=150,
-            is_active=True,
-        ),
-    ]
-
-    for event in events:
-        db.add(event)
-    db.commit()
-    print(f"✅ Seeded {len(events)} events successfully.")
+def _check_token(authorization: str, token: str):
+    """Bearer check for the operator endpoints (metrics, import, reports)."""
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=401, detail="Invalid token")
 
 
 @app.on_event("startup")
-def startup_event():
-    try:
-        db = next(get_db())
-        seed_events(db)
-        db.close()
-    except Exception as e:
-        print("Startup Error:", e)
+async def startup_event():
+    passwords.password_pool.warm_up()
+    if reservations.HOLD_RELEASE_INTERVAL > 0:
+        _background_tasks.append(asyncio.get_running_loop().create_task(reservations.release_loop()))
+    if confirmations.CONFIRM_PIPELINE:
+        _background_tasks.append(confirmations.pipeline.start())
+    if seatfeed.SEAT_FEED_ENABLED:
+        _background_tasks.append(seatfeed.broadcaster.start())
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    for task in _background_tasks:
+        task.cancel()
+    passwords.password_pool.shutdown()
 
 # ─────────────────────────────────────────────
 # Auth Routes
 # ─────────────────────────────────────────────
-@app.post("/auth/register", response_model=schemas.TokenResponse)
-def register(data: schemas.RegisterRequest, db: Session = Depends(get_db)):
-    existing = db.query(models.User).filter(models.User.email == data.email).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    user = models.User(
-        name=data.name,
-        email=data.email,
-        hashed_password=hash_password(data.password),
-        phone=data.phone,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+def _token_response(user: models.User) -> schemas.TokenResponse:
     token = create_access_token({"sub": str(user.id)})
     return schemas.TokenResponse(
         access_token=token,
@@ -337,38 +110,487 @@ def register(data: schemas.RegisterRequest, db: Session = Depends(get_db)):
     )
 
 
-@app.post("/auth/login", response_model=schemas.TokenResponse)
-def login(data: schemas.LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == data.email).first()
-    if not user or not verify_password(data.password, user.hashed_password):
-        raise HTTPException(status_code=401, detail="Invalid email or password")
-    token = create_access_token({"sub": str(user.id)})
-    return schemas.TokenResponse(
-        access_token=token,
-        user_id=user.id,
-        name=user.name,
-        email=user.email
+def _find_user(db: Session, email: str):
+    user = db.query(models.User).filter(models.User.email == email).first()
+    # Give the connection back before the caller waits on bcrypt
+    db.close()
+    return user
+
+
+def _create_user(db: Session, data: schemas.RegisterRequest, hashed_password: str):
+    user = models.User(
+        name=data.name,
+        email=data.email,
+        hashed_password=hashed_password,
+        phone=data.phone,
     )
+    db.add(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
+    db.refresh(user)
+    return _token_response(user)
+
+
+# Rate limits and the concurrency cap run before any DB or bcrypt work
+_auth_admission = [Depends(ratelimit.limit_auth_ip), Depends(ratelimit.auth_slot)]
+
+
+@app.post("/auth/register", response_model=schemas.TokenResponse, dependencies=_auth_admission)
+async def register(data: schemas.RegisterRequest, db=Depends(get_session)):
+    if await run_db(db, _find_user, data.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    hashed_password = await passwords.hash_password_async(data.password)
+    return await run_db(db, _create_user, data, hashed_password)
+
+
+@app.post("/auth/login", response_model=schemas.TokenResponse, dependencies=_auth_admission)
+async def login(data: schemas.LoginRequest, db=Depends(get_session)):
+    ratelimit.limit_auth_email(data.email)
+    user = await run_db(db, _find_user, data.email)
+    if not user or not await passwords.verify_password_async(data.password, user.hashed_password):
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+    return _token_response(user)
 
 # ─────────────────────────────────────────────
 # Events Routes
 # ─────────────────────────────────────────────
-@app.get("/events", response_model=list[schemas.EventResponse])
-def get_events(search: str = None, category: str = None, db: Session = Depends(get_db)):
+def _events_query(db: Session, search: str = None, category: str = None, ranked: bool = True):
     query = db.query(models.Event).filter(models.Event.is_active == True)
     if search:
-        query = query.filter(or_(
-            models.Event.title.ilike(f"%{search}%"),
-            models.Event.location.ilike(f"%{search}%"),
-            models.Event.description.ilike(f"%{search}%"),
-        ))
+        query = fulltext.apply_search(query, search, ranked=ranked)
     if category and category.lower() != "all":
-        query = query.filter(models.Event.category.ilike(category))
-    return query.order_by(models.Event.date.asc()).all()
+        # Equality on lower(): served by ix_events_active_category
+        query = query.filter(func.lower(models.Event.category) == category.lower())
+    return query
+
+
+def _stream_events(sessions, search: str = None, category: str = None):
+    # Owns its session: the response body outlives the request dependencies.
+    db = sessions()
+    try:
+        query = _events_query(db, search, category, ranked=False)
+        query = pagination.keyset(query, models.Event.date, models.Event.id)
+        yield b"["
+        first = True
+        for event in serialization.project_events(query).yield_per(STREAM_BATCH_SIZE):
+            if not first:
+                yield b","
+            first = False
+            yield serialization.encode_event(event)
+        yield b"]"
+    finally:
+        db.close()
+
+
+def _load_events(db: Session, search: str, category: str, limit: int, cursor: str):
+    if limit is None and cursor is None:
+        query = _events_query(db, search, category).order_by(models.Event.date.asc())
+        return serialization.encode_events(serialization.project_events(query).all()), None
+
+    query = _events_query(db, search, category, ranked=False)
+    query = pagination.keyset(query, models.Event.date, models.Event.id, cursor)
+    events, next_cursor = pagination.page(serialization.project_events(query), limit or pagination.DEFAULT_LIMIT, "date")
+    return serialization.encode_events(events), next_cursor
+
+
+def _catalog_on_primary() -> bool:
+    # A replica that hasn't caught up with a just-committed catalog write
+    # would put the old rows back in the cache for the full TTL. Seat
+    # counts don't count: they change with every hold, and clients get
+    # fresh ones from the seat feed.
+    return time.monotonic() - cache.catalog_written_at < REPLICA_LAG_WINDOW
+
+
+async def get_catalog_session():
+    sessions = get_session() if _catalog_on_primary() else get_read_session()
+    async for db in sessions:
+        yield db
+
+
+@app.get("/events", response_model=list[schemas.EventResponse])
+async def get_events(
+    search: str = None,
+    category: str = None,
+    limit: int = Query(None, ge=1, le=pagination.MAX_LIMIT),
+    cursor: str = None,
+    stream: bool = False,
+    if_none_match: str = Header(None),
+    db=Depends(get_catalog_session),
+):
+    if stream:
+        if limit is not None or cursor is not None:
+            raise HTTPException(status_code=400, detail="stream=true can't be combined with limit or cursor")
+        sessions = SessionLocal if _catalog_on_primary() else ReadSessionLocal
+        return StreamingResponse(_stream_events(sessions, search, category), media_type="application/json")
+
+    key = (search, category.lower() if category else None, limit, cursor)
+    entry = cache.catalog_cache.get(key)
+    if entry is None:
+        generation = cache.catalog_cache.generation
+        body, next_cursor = await run_db(db, _load_events, search, category, limit, cursor)
+        entry = (body, cache.make_etag(body), next_cursor)
+        cache.catalog_cache.set(key, entry, generation)
+
+    body, etag, next_cursor = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if next_cursor:
+        headers[pagination.NEXT_CURSOR_HEADER] = next_cursor
+    if cache.etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/events/suggest", response_model=list[schemas.SuggestionResponse])
+async def suggest_events(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(suggest.SUGGEST_LIMIT, ge=1, le=20),
+):
+    """Typeahead completions from the in-memory index; see suggest.py."""
+    await suggest.ensure_loaded()
+    return suggest.index.search(q, limit)
+
+
+@app.get("/events/seats/stream")
+async def seat_stream(last_event_id: str = Header(None)):
+    """Server-sent events: `seats` frames map event id -> available seats."""
+    if not seatfeed.broadcaster.running:
+        return Response(status_code=204)  # tells SSE clients not to reconnect
+    if seatfeed.broadcaster.clients >= seatfeed.SEAT_FEED_MAX_CLIENTS:
+        raise HTTPException(status_code=503, detail="Too many live connections", headers={"Retry-After": "30"})
+    return StreamingResponse(
+        seatfeed.broadcaster.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+if bulk_import.IMPORT_TOKEN:
+    @app.post("/events/import", response_model=schemas.ImportResponse)
+    async def import_events(
+        request: Request,
+        fmt: str = Query(None, alias="format"),
+        max_errors: int = Query(bulk_import.IMPORT_MAX_ERRORS, ge=0),
+        authorization: str = Header(None),
+    ):
+        """Upsert events from a CSV or NDJSON body; see bulk_import.py."""
+        _check_token(authorization, bulk_import.IMPORT_TOKEN)
+        fmt = bulk_import.detect_format(fmt or request.headers.get("content-type"))
+        body = await bulk_import.spool_body(request.stream())
+        try:
+            return await run_in_threadpool(bulk_import.run_import, body, fmt, max_errors=max_errors)
+        finally:
+            body.close()
+
+# ─────────────────────────────────────────────
+# Profile Routes
+# ─────────────────────────────────────────────
+@app.get("/profile", response_model=schemas.UserProfileResponse)
+async def get_profile(user: schemas.UserProfileResponse = Depends(get_current_user)):
+    return user
+
+
+def _bookings_query(db: Session, user_id: int, summary: bool):
+    if summary:
+        # Column-only projection: one joined query, no ORM identity map
+        query = db.query(
+            models.Booking.id,
+            models.Booking.event_id,
+            models.Booking.amount,
+            models.Booking.quantity,
+            models.Booking.status,
+            models.Booking.booked_at,
+            models.Event.title.label("event_title"),
+            models.Event.date.label("event_date"),
+            models.Event.location.label("event_location"),
+            models.Event.category.label("event_category"),
+        ).join(models.Event, models.Booking.event_id == models.Event.id)
+    else:
+        # One query for the bookings, one IN (...) query for all their events
+        query = db.query(models.Booking).options(selectinload(models.Booking.event))
+    return query.filter(models.Booking.user_id == user_id)
+
+
+def _load_bookings(db: Session, user_id: int, summary: bool, limit: int, cursor: str):
+    schema = schemas.BookingSummaryResponse if summary else schemas.BookingResponse
+    query = pagination.keyset(
+        _bookings_query(db, user_id, summary),
+        models.Booking.booked_at, models.Booking.id, cursor, descending=True,
+    )
+    if limit is None and cursor is None:
+        rows, next_cursor = query.all(), None
+    else:
+        rows, next_cursor = pagination.page(query, limit or pagination.DEFAULT_LIMIT, "booked_at")
+    return [schema.model_validate(row) for row in rows], next_cursor
+
+
+@app.get(
+    "/profile/bookings",
+    response_model=list[schemas.BookingResponse] | list[schemas.BookingSummaryResponse],
+)
+async def get_profile_bookings(
+    response: Response,
+    summary: bool = False,
+    limit: int = Query(None, ge=1, le=pagination.MAX_LIMIT),
+    cursor: str = None,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    bookings, next_cursor = await run_db(db, _load_bookings, user.id, summary, limit, cursor)
+    if next_cursor:
+        response.headers[pagination.NEXT_CURSOR_HEADER] = next_cursor
+    return bookings
+
+
+@app.get("/profile/spend", response_model=schemas.UserSpendResponse)
+async def get_profile_spend(
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    return await run_db(db, sales.user_spend, user.id)
+
+# ─────────────────────────────────────────────
+# Booking Routes
+# ─────────────────────────────────────────────
+def _hold_response(booking: models.Booking) -> schemas.HoldResponse:
+    return schemas.HoldResponse(
+        booking_id=booking.id,
+        event_id=booking.event_id,
+        quantity=booking.quantity,
+        amount=booking.amount,
+        status=booking.status,
+        hold_expires_at=booking.hold_expires_at,
+    )
+
+
+def _hold(db: Session, user_id: int, data: schemas.HoldRequest):
+    return _hold_response(reservations.hold_seats(db, user_id, data.event_id, data.quantity))
+
+
+def _cancel(db: Session, user_id: int, booking_id: int):
+    cancelled = reservations.cancel_hold(db, booking_id, user_id)
+    if cancelled is None:
+        raise HTTPException(status_code=404, detail="No pending booking to cancel")
+    return cancelled
+
+
+@app.post("/bookings/hold", response_model=schemas.HoldResponse)
+async def hold_seats(
+    data: schemas.HoldRequest,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    return await run_db(db, _hold, user.id, data)
+
+
+@app.delete("/bookings/{booking_id}", status_code=204)
+async def cancel_booking(
+    booking_id: int,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    cancelled = await run_db(db, _cancel, user.id, booking_id)
+    payments.forget_order((user.id, cancelled.event_id, cancelled.quantity, cancelled.amount))
+
+# ─────────────────────────────────────────────
+# Payment Routes
+# ─────────────────────────────────────────────
+def limit_payments(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    # Keyed on the token's subject so a rejected request never loads the
+    # user; route dependencies run before the handler's get_current_user.
+    ratelimit.payment_user_limit.check(decode_token(credentials.credentials))
+
+
+def _event_price(db: Session, event_id: int) -> float:
+    price = db.query(models.Event.price).filter(
+        models.Event.id == event_id, models.Event.is_active == True
+    ).scalar()
+    # Don't sit on a pooled connection while the gateway call is in flight
+    db.close()
+    if price is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return price
+
+
+def _attach_order(db: Session, booking_id: int, order_id: str):
+    db.query(models.Booking).filter(models.Booking.id == booking_id).update(
+        {models.Booking.razorpay_order_id: order_id}, synchronize_session=False
+    )
+    db.commit()
+
+
+@app.post(
+    "/payment/create-order",
+    response_model=schemas.CreateOrderResponse,
+    dependencies=[Depends(limit_payments)],
+)
+async def create_order(
+    data: schemas.CreateOrderRequest,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    price = await run_db(db, _event_price, data.event_id)
+    amount = price * data.quantity
+
+    async def create():
+        hold = await run_db(db, _hold, user.id, schemas.HoldRequest(event_id=data.event_id, quantity=data.quantity))
+        if hold.amount == 0:
+            order_id = f"order_free_{hold.booking_id}"
+        else:
+            try:
+                order = await payments.create_gateway_order(
+                    hold.amount,
+                    receipt=f"booking_{hold.booking_id}",
+                    notes={"booking_id": str(hold.booking_id), "event_id": str(data.event_id)},
+                )
+            except HTTPException:
+                await run_db(db, reservations.cancel_hold, hold.booking_id, user.id)
+                raise
+            order_id = order["id"]
+        await run_db(db, _attach_order, hold.booking_id, order_id)
+        return schemas.CreateOrderResponse(
+            order_id=order_id,
+            booking_id=hold.booking_id,
+            amount=hold.amount,
+            currency=payments.CURRENCY,
+            key_id=payments.get_gateway().key_id,
+            hold_expires_at=hold.hold_expires_at,
+        )
+
+    async def is_live(order: schemas.CreateOrderResponse) -> bool:
+        return await run_db(db, _booking_status, order.booking_id, user.id) == "pending"
+
+    return await payments.idempotent_order((user.id, data.event_id, data.quantity, amount), create, is_live)
+
+
+def _booking_for_order(db: Session, order_id: str, user_id: int) -> int:
+    booking_id = db.query(models.Booking.id).filter(
+        models.Booking.razorpay_order_id == order_id, models.Booking.user_id == user_id
+    ).scalar()
+    db.close()
+    if booking_id is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return booking_id
+
+
+def _booking_status(db: Session, booking_id: int, user_id: int) -> str:
+    status = db.query(models.Booking.status).filter(
+        models.Booking.id == booking_id, models.Booking.user_id == user_id
+    ).scalar()
+    # Released so long-polls don't hold a pooled connection while they wait
+    db.close()
+    if status is None:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return status
+
+
+async def _wait_for_status(db, booking_id: int, user_id: int, wait: float) -> str:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        status = (confirmations.pipeline.recent_status(booking_id, user_id)
+                  or await run_db(db, _booking_status, booking_id, user_id))
+        remaining = deadline - loop.time()
+        if status != "pending" or remaining <= 0:
+            return status
+        await confirmations.pipeline.wait_for_batch(min(remaining, LONG_POLL_RECHECK))
+
+
+@app.post(
+    "/payment/verify",
+    response_model=schemas.BookingStatusResponse,
+    status_code=202,
+    dependencies=[Depends(limit_payments)],
+)
+async def verify_payment(
+    data: schemas.VerifyPaymentRequest,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    if not payments.verify_payment_signature(data.razorpay_order_id, data.razorpay_payment_id, data.razorpay_signature):
+        raise HTTPException(status_code=400, detail="Invalid payment signature")
+    booking_id = await run_db(db, _booking_for_order, data.razorpay_order_id, user.id)
+    await confirmations.pipeline.submit(data.razorpay_order_id, data.razorpay_payment_id, booking_id, user.id)
+    return schemas.BookingStatusResponse(booking_id=booking_id, status="pending")
+
+
+@app.post(
+    "/payment/confirm-test",
+    response_model=schemas.BookingStatusResponse,
+    dependencies=[Depends(limit_payments)],
+)
+async def confirm_test_payment(
+    data: schemas.TestConfirmRequest,
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    if not payments.PAYMENT_ALLOW_TEST_CONFIRM:
+        raise HTTPException(status_code=403, detail="Test confirmation is disabled")
+    booking_id = await run_db(db, _booking_for_order, data.razorpay_order_id, user.id)
+    await confirmations.pipeline.submit(data.razorpay_order_id, data.razorpay_payment_id, booking_id, user.id)
+    status = await _wait_for_status(db, booking_id, user.id, CONFIRM_TEST_WAIT)
+    if status != "confirmed":
+        raise HTTPException(status_code=409, detail=f"Booking could not be confirmed ({status})")
+    return schemas.BookingStatusResponse(booking_id=booking_id, status=status)
+
+
+@app.post("/payment/webhook")
+async def payment_webhook(request: Request):
+    if payments.PAYMENT_GATEWAY == "fake":
+        raise HTTPException(status_code=403, detail="Webhooks are disabled for the fake gateway")
+    body = await request.body()
+    if not payments.verify_webhook_signature(body, request.headers.get("X-Razorpay-Signature")):
+        raise HTTPException(status_code=400, detail="Invalid webhook signature")
+    payload = json.loads(body)
+    if payload.get("event") in ("payment.captured", "order.paid"):
+        payment = payload["payload"]["payment"]["entity"]
+        await confirmations.pipeline.submit(payment["order_id"], payment["id"])
+    return {"status": "ok"}
+
+
+@app.get("/bookings/{booking_id}/status", response_model=schemas.BookingStatusResponse)
+async def booking_status(
+    booking_id: int,
+    wait: float = Query(0, ge=0, le=25),
+    user: schemas.UserProfileResponse = Depends(get_current_user),
+    db=Depends(get_session),
+):
+    status = await _wait_for_status(db, booking_id, user.id, wait)
+    return schemas.BookingStatusResponse(booking_id=booking_id, status=status)
+
+# ─────────────────────────────────────────────
+# Reports: read the sales rollups only (see sales.py)
+# ─────────────────────────────────────────────
+if sales.REPORTS_TOKEN:
+    @app.get("/reports/sales", response_model=list[schemas.SalesReportRow])
+    async def sales_report(
+        group: str = Query("event", pattern="^(event|category|day)$"),
+        start: date = None,
+        end: date = None,
+        limit: int = Query(50, ge=1, le=1000),
+        authorization: str = Header(None),
+        db=Depends(get_read_session),
+    ):
+        _check_token(authorization, sales.REPORTS_TOKEN)
+        return await run_db(db, sales.sales_report, group, start, end, limit)
+
+    @app.get("/reports/users/{user_id}/spend", response_model=schemas.UserSpendResponse)
+    async def user_spend_report(user_id: int, authorization: str = Header(None), db=Depends(get_read_session)):
+        _check_token(authorization, sales.REPORTS_TOKEN)
+        return await run_db(db, sales.user_spend, user_id)
 
 # ─────────────────────────────────────────────
 # Health Check
 # ─────────────────────────────────────────────
 @app.get("/")
 def root():
-    return {"status": "Event Booking API running"}
\ No newline at end of file
+    return {"status": "Event Booking API running"}
+
+
+if metrics.METRICS_ENABLED:
+    @app.get(metrics.METRICS_PATH, include_in_schema=False)
+    def get_metrics(authorization: str = Header(None)):
+        _check_token(authorization, metrics.METRICS_TOKEN)
+        return Response(metrics.render(), media_type="text/plain; version=0.0.4")
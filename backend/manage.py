@@ -0,0 +1,69 @@
+"""Operational commands, kept off the request path.
+
+    python manage.py init-db    create or upgrade tables/indexes, record the schema fingerprint
+    python manage.py seed       load the demo event catalog (no-op when events exist)
+    python manage.py import-events FILE
+                                upsert events from CSV/NDJSON (FILE "-" reads stdin)
+    python manage.py rebuild-rollups
+                                recompute the sales rollups from bookings
+"""
+import argparse
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event Booking API management")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("init-db", help="create or upgrade the schema")
+    commands.add_parser("seed", help="seed the demo event catalog")
+    importer = commands.add_parser("import-events", help="bulk upsert events from CSV or NDJSON")
+    importer.add_argument("file")
+    importer.add_argument("--format", choices=["csv", "ndjson"], help="default: from the file extension")
+    importer.add_argument("--batch-size", type=int)
+    importer.add_argument("--max-errors", type=int)
+    commands.add_parser("rebuild-rollups", help="recompute the sales rollups from bookings")
+    args = parser.parse_args()
+
+    from database import engine
+    import bootstrap
+
+    if args.command == "init-db":
+        bootstrap.migrate(engine)
+        print("✅ Schema is up to date.")
+    elif args.command == "seed":
+        bootstrap.ensure_schema(engine, mode="fingerprint")
+        bootstrap.seed_demo_events()
+    elif args.command == "import-events":
+        from fastapi import HTTPException
+        import bulk_import
+
+        bootstrap.ensure_schema(engine, mode="fingerprint")
+        options = {"batch_size": args.batch_size, "max_errors": args.max_errors}
+        options = {k: v for k, v in options.items() if v is not None}
+        stream = sys.stdin.buffer if args.file == "-" else open(args.file, "rb")
+        try:
+            result = bulk_import.run_import(stream, args.format or bulk_import.detect_format(args.file), **options)
+        except HTTPException as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {"message": exc.detail, "errors": []}
+            for error in detail["errors"]:
+                print(f"  invalid {error}")
+            sys.exit(f"❌ Import failed: {detail['message']}")
+        finally:
+            stream.close()
+        for error in result["errors"]:
+            print(f"  skipped {error}")
+        print(
+            f"✅ Imported {result['rows_written']} events from {result['rows_read']} rows "
+            f"({result['rows_invalid']} invalid) in {result['seconds']}s, {result['rows_per_sec']:,.0f} rows/s."
+        )
+    elif args.command == "rebuild-rollups":
+        import sales
+
+        bootstrap.ensure_schema(engine, mode="fingerprint")
+        with engine.begin() as conn:
+            sales.rebuild(conn)
+        print("✅ Sales rollups rebuilt.")
+
+
+if __name__ == "__main__":
+    main()
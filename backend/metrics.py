@@ -0,0 +1,207 @@
+import bisect
+import contextvars
+import os
+import threading
+import time
+from sqlalchemy import event
+from database import pool_stats
+
+# ─────────────────────────────────────────────
+# Request and database metrics in Prometheus text format
+#
+# Opt-in with METRICS_ENABLED=1, which adds the middleware, the engine
+# hooks and GET /metrics. Set METRICS_TOKEN to require
+# "Authorization: Bearer <token>" on the endpoint.
+#
+# Everything is plain in-process counters: each worker process reports
+# its own numbers, so scrape every worker (or aggregate in Prometheus).
+# ─────────────────────────────────────────────
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_PATH = "/metrics"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+
+_lock = threading.Lock()
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self.kind = "counter"
+        self.values = {}
+
+    def inc(self, key: tuple = (), amount: float = 1):
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        for key, value in self.values.items():
+            yield self.name, _labels(self.labels, key), value
+
+
+class Gauge(Counter):
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        super().__init__(name, help, labels)
+        self.kind = "gauge"
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self.kind = "histogram"
+        self.values = {}  # key -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value: float, key: tuple = ()):
+        index = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            series = self.values.get(key)
+            if series is None:
+                series = self.values[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        for key, series in self.values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                yield f"{self.name}_bucket", _labels((*self.labels, "le"), (*key, bound)), cumulative
+            yield f"{self.name}_sum", _labels(self.labels, key), series[-1]
+            yield f"{self.name}_count", _labels(self.labels, key), cumulative
+
+
+def _labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+requests_total = Counter("http_requests_total", "HTTP requests by route and status.", ("method", "route", "status"))
+request_seconds = Histogram("http_request_duration_seconds", "HTTP request latency.", ("method", "route"))
+in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements per HTTP request.", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+request_db_seconds = Histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per HTTP request.", ("method", "route"), DB_TIME_BUCKETS
+)
+queries_total = Counter("db_queries_total", "SQL statements executed.")
+query_seconds = Histogram("db_query_duration_seconds", "SQL statement latency.", buckets=DB_TIME_BUCKETS)
+checkout_seconds = Histogram(
+    "db_pool_checkout_wait_seconds", "Time to get a connection from the pool.", buckets=DB_TIME_BUCKETS
+)
+pool_checked_out = Gauge("db_pool_checked_out", "Connections currently checked out of the pool.", ("pool",))
+pool_idle = Gauge("db_pool_idle", "Idle connections in the pool.", ("pool",))
+pool_overflow = Gauge("db_pool_overflow", "Connections opened beyond the pool size.", ("pool",))
+pool_size = Gauge("db_pool_size", "Configured pool size (0 for NullPool).", ("pool",))
+
+REGISTRY = [
+    requests_total, request_seconds, in_flight, request_queries, request_db_seconds,
+    queries_total, query_seconds, checkout_seconds, pool_checked_out, pool_idle, pool_overflow, pool_size,
+]
+
+# Per-request DB totals; run_in_threadpool and run_sync both carry it over.
+_request_db = contextvars.ContextVar("request_db", default=None)
+
+
+# ─────────────────────────────────────────────
+# ASGI middleware
+# ─────────────────────────────────────────────
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        db = [0, 0.0]  # queries, seconds
+        _request_db.set(db)
+        status = [500]
+        start = time.perf_counter()
+        in_flight.inc(amount=1)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.inc(amount=-1)
+            route = scope.get("route")
+            # Route templates only: raw paths would explode the label set
+            key = (scope["method"], route.path if route is not None else "unmatched")
+            request_seconds.observe(time.perf_counter() - start, key)
+            requests_total.inc((*key, status[0]))
+            request_queries.observe(db[0], key)
+            request_db_seconds.observe(db[1], key)
+
+
+# ─────────────────────────────────────────────
+# Engine hooks
+# ─────────────────────────────────────────────
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    queries_total.inc()
+    query_seconds.observe(elapsed)
+    db = _request_db.get()
+    if db is not None:
+        db[0] += 1
+        db[1] += elapsed
+
+
+def instrument_engine(engine):
+    """Attach query and pool-checkout timing to a (sync) Engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    # The pool has no "before checkout" event, so time raw_connection(),
+    # which covers waiting for a free slot plus the pre-ping.
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        start = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            checkout_seconds.observe(time.perf_counter() - start)
+
+    engine.raw_connection = timed_raw_connection
+
+
+def _collect_pool_stats():
+    stats = pool_stats()
+    with _lock:
+        for name, pool in stats.items():
+            pool_checked_out.values[(name,)] = pool["checked_out"]
+            pool_idle.values[(name,)] = pool["idle"]
+            pool_overflow.values[(name,)] = pool["overflow"]
+            pool_size.values[(name,)] = pool["size"]
+
+
+# ─────────────────────────────────────────────
+# Exposition
+# ─────────────────────────────────────────────
+def render() -> str:
+    _collect_pool_stats()
+    lines = []
+    with _lock:
+        for metric in REGISTRY:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in list(metric.samples()):
+                lines.append(f"{name}{labels} {value}")
+    return "\n".join(lines) + "\n"
@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -34,9 +39,30 @@ class Event(Base):
 
     bookings = relationship("Booking", back_populates="event")
 
+    # Partial on the live catalog: GET /events never reads inactive rows.
+    # The predicate must match the route's `is_active == True` filter.
+    __table_args__ = (
+        Index(
+            "ix_events_active_date", "date", "id",
+            postgresql_where=is_active == True, sqlite_where=is_active == True,
+        ),
+        Index(
+            "ix_events_active_category", func.lower(category), "date", "id",
+            postgresql_where=is_active == True, sqlite_where=is_active == True,
+        ),
+        # Natural key for bulk imports: ON CONFLICT needs it to be unique
+        Index("ix_events_natural_key", "title", "location", "date", unique=True),
+    )
+
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        Index("ix_bookings_user_booked_at", "user_id", "booked_at"),
+        Index("ix_bookings_event_status", "event_id", "status"),
+        Index("ix_bookings_status_expires", "status", "hold_expires_at"),
+        Index("ix_bookings_razorpay_order_id", "razorpay_order_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -44,8 +70,65 @@ class Booking(Base):
     razorpay_order_id = Column(String(100), nullable=True)
     razorpay_payment_id = Column(String(100), nullable=True)
     amount = Column(Float, nullable=False)
-    status = Column(String(20), default="pending")  # pending, confirmed, cancelled
-    booked_at = Column(DateTime(timezone=True), server_default=func.now())
+    quantity = Column(Integer, nullable=False, default=1)
+    status = Column(String(20), default="pending")  # pending, confirmed, cancelled, expired, refund_pending
+    hold_expires_at = Column(DateTime(timezone=True), nullable=True)  # seats held until then while pending
+    # Set in Python so SQLite stores the same format pagination cursors bind
+    # (its CURRENT_TIMESTAMP has no fractional seconds)
+    booked_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
 
     user = relationship("User", back_populates="bookings")
-    event = relationship("Event", back_populates="bookings")
\ No newline at end of file
+    event = relationship("Event", back_populates="bookings")
+
+
+# ─────────────────────────────────────────────
+# Sales rollups: confirmed bookings summed by sales.record_sales in the
+# confirming transaction. Reports read these, never bookings.
+# ─────────────────────────────────────────────
+class EventSales(Base):
+    __tablename__ = "event_sales"
+
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+    tickets = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0)
+
+
+class EventSalesDaily(Base):
+    __tablename__ = "event_sales_daily"
+    __table_args__ = (
+        Index("ix_event_sales_daily_day", "day", "event_id"),  # date-ranged reports
+    )
+
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    day = Column(Date, primary_key=True)  # the booking's booked_at date
+    bookings = Column(Integer, nullable=False, default=0)
+    tickets = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0)
+
+
+class CategorySalesDaily(Base):
+    __tablename__ = "category_sales_daily"
+
+    category = Column(String(50), primary_key=True)
+    day = Column(Date, primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+    tickets = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0)
+
+
+class UserSpend(Base):
+    __tablename__ = "user_spend"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    bookings = Column(Integer, nullable=False, default=0)
+    tickets = Column(Integer, nullable=False, default=0)
+    total_spent = Column(Float, nullable=False, default=0)
+
+
+class SchemaMeta(Base):
+    __tablename__ = "schema_meta"
+
+    id = Column(Integer, primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
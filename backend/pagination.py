@@ -0,0 +1,51 @@
+import base64
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+# ─────────────────────────────────────────────
+# Keyset (cursor) pagination
+#
+# A cursor is the (sort value, id) of the last row on the previous page,
+# so each page is a range scan on the sort index instead of an OFFSET that
+# grows with the page number.
+# ─────────────────────────────────────────────
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset(query, sort_col, id_col, cursor: str = None, descending: bool = False):
+    if cursor:
+        key = decode_cursor(cursor)
+        if descending:
+            query = query.filter(tuple_(sort_col, id_col) < tuple_(*key))
+        else:
+            query = query.filter(tuple_(sort_col, id_col) > tuple_(*key))
+    if descending:
+        return query.order_by(sort_col.desc(), id_col.desc())
+    return query.order_by(sort_col.asc(), id_col.asc())
+
+
+def page(query, limit: int, sort_attr: str):
+    """Fetch one page; returns (rows, next_cursor or None)."""
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_attr), last.id)
@@ -0,0 +1,98 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+# ─────────────────────────────────────────────
+# Password hashing off the request path
+#
+# bcrypt burns 100-300 ms of CPU per call while holding the GIL, so it runs
+# in a dedicated process pool. When more than PASSWORD_MAX_PENDING
+# operations are queued, new ones are rejected with 503 instead of piling
+# up behind the pool. PASSWORD_WORKERS=0 hashes on the threadpool instead,
+# for platforms without multiprocessing (e.g. serverless functions).
+# ─────────────────────────────────────────────
+# Serverless functions can't keep a process pool alive between invocations
+_default_workers = 0 if os.getenv("VERCEL") else min(4, os.cpu_count() or 1)
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", _default_workers))
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", max(PASSWORD_WORKERS, 1) * 8))
+PASSWORD_RETRY_AFTER = os.getenv("PASSWORD_RETRY_AFTER", "1")
+
+_pwd_context = None
+
+
+def _context():
+    # passlib/bcrypt are imported on first use, not on cold start
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
+
+
+def hash_password(password: str) -> str:
+    return _context().hash(password)
+
+
+def verify_password(plain: str, hashed: str) -> bool:
+    return _context().verify(plain, hashed)
+
+
+class PasswordPool:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            # spawn: forking a process that already runs threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server busy, please retry",
+                    headers={"Retry-After": PASSWORD_RETRY_AFTER},
+                )
+            self.pending += 1
+        try:
+            if self.workers <= 0:
+                return await run_in_threadpool(fn, *args)
+            return await asyncio.wrap_future(self._get_executor().submit(fn, *args))
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    def warm_up(self):
+        if self.workers > 0:
+            executor = self._get_executor()
+            for _ in range(self.workers):
+                executor.submit(os.getpid)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordPool(PASSWORD_WORKERS, PASSWORD_MAX_PENDING)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await password_pool.run(verify_password, plain, hashed)
@@ -0,0 +1,162 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+import uuid
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from cache import TTLCache
+from reservations import SEAT_HOLD_SECONDS
+
+# ─────────────────────────────────────────────
+# Payment gateway
+#
+# PAYMENT_GATEWAY=razorpay talks to Razorpay through one keep-alive,
+# connection-pooled HTTP session with explicit timeouts. Default; the
+# app refuses to start without RAZORPAY_KEY_ID and RAZORPAY_KEY_SECRET.
+# PAYMENT_GATEWAY=fake is an in-process stand-in for local runs and
+# offline benchmarks. Its secrets are public, so it is only used when
+# asked for by name, and it takes no webhooks.
+# ─────────────────────────────────────────────
+RAZORPAY_KEY_ID = os.getenv("RAZORPAY_KEY_ID", "")
+RAZORPAY_KEY_SECRET = os.getenv("RAZORPAY_KEY_SECRET", "")
+RAZORPAY_WEBHOOK_SECRET = os.getenv("RAZORPAY_WEBHOOK_SECRET", "")
+PAYMENT_GATEWAY = os.getenv("PAYMENT_GATEWAY", "razorpay").lower()
+# /payment/confirm-test skips the signature check: local runs with the fake gateway only
+PAYMENT_ALLOW_TEST_CONFIRM = os.getenv("PAYMENT_ALLOW_TEST_CONFIRM", "0") == "1"
+PAYMENT_POOL_SIZE = int(os.getenv("PAYMENT_POOL_SIZE", 20))
+PAYMENT_CONNECT_TIMEOUT = float(os.getenv("PAYMENT_CONNECT_TIMEOUT", 3))
+PAYMENT_READ_TIMEOUT = float(os.getenv("PAYMENT_READ_TIMEOUT", 10))
+FAKE_GATEWAY_LATENCY_MS = float(os.getenv("FAKE_GATEWAY_LATENCY_MS", 0))
+ORDER_CACHE_SIZE = int(os.getenv("ORDER_CACHE_SIZE", 10000))
+CURRENCY = "INR"
+
+if PAYMENT_GATEWAY not in ("razorpay", "fake"):
+    raise RuntimeError(f"PAYMENT_GATEWAY must be 'razorpay' or 'fake', not {PAYMENT_GATEWAY!r}")
+if PAYMENT_GATEWAY == "razorpay" and not (RAZORPAY_KEY_ID and RAZORPAY_KEY_SECRET):
+    raise RuntimeError("RAZORPAY_KEY_ID and RAZORPAY_KEY_SECRET must be set (or PAYMENT_GATEWAY=fake for local runs)")
+
+
+class RazorpayGateway:
+    key_id = RAZORPAY_KEY_ID
+    key_secret = RAZORPAY_KEY_SECRET
+    webhook_secret = RAZORPAY_WEBHOOK_SECRET
+
+    def __init__(self):
+        import razorpay
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=PAYMENT_POOL_SIZE, max_retries=0)
+        session.mount("https://", adapter)
+        self._client = razorpay.Client(session=session, auth=(RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET))
+
+    def create_order(self, amount_paise: int, receipt: str, notes: dict) -> dict:
+        return self._client.order.create(
+            data={"amount": amount_paise, "currency": CURRENCY, "receipt": receipt, "notes": notes},
+            timeout=(PAYMENT_CONNECT_TIMEOUT, PAYMENT_READ_TIMEOUT),
+        )
+
+
+class FakeGateway:
+    key_id = "rzp_test_fake"
+    key_secret = "fake_secret"
+    webhook_secret = "fake_webhook_secret"
+
+    def create_order(self, amount_paise: int, receipt: str, notes: dict) -> dict:
+        if FAKE_GATEWAY_LATENCY_MS:
+            time.sleep(FAKE_GATEWAY_LATENCY_MS / 1000)
+        return {
+            "id": f"order_fake_{uuid.uuid4().hex[:14]}",
+            "entity": "order",
+            "amount": amount_paise,
+            "currency": CURRENCY,
+            "receipt": receipt,
+            "notes": notes,
+            "status": "created",
+            "created_at": int(time.time()),
+        }
+
+
+_gateway = None
+
+
+def get_gateway():
+    global _gateway
+    if _gateway is None:
+        _gateway = RazorpayGateway() if PAYMENT_GATEWAY == "razorpay" else FakeGateway()
+    return _gateway
+
+
+async def create_gateway_order(amount: float, receipt: str, notes: dict) -> dict:
+    try:
+        return await run_in_threadpool(get_gateway().create_order, round(amount * 100), receipt, notes)
+    except Exception as e:
+        print("Payment gateway error:", e)
+        raise HTTPException(status_code=502, detail="Payment gateway unavailable, please retry")
+
+
+# ─────────────────────────────────────────────
+# Signatures
+# ─────────────────────────────────────────────
+def _hmac_hex(secret: str, message: bytes) -> str:
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_payment(order_id: str, payment_id: str) -> str:
+    return _hmac_hex(get_gateway().key_secret, f"{order_id}|{payment_id}".encode())
+
+
+def verify_payment_signature(order_id: str, payment_id: str, signature: str) -> bool:
+    # An empty key would make every signature forgeable
+    return bool(get_gateway().key_secret) and hmac.compare_digest(sign_payment(order_id, payment_id), signature or "")
+
+
+def verify_webhook_signature(body: bytes, signature: str) -> bool:
+    gateway = get_gateway()
+    if isinstance(gateway, FakeGateway):
+        return False
+    return bool(gateway.webhook_secret) and hmac.compare_digest(_hmac_hex(gateway.webhook_secret, body), signature or "")
+
+# ─────────────────────────────────────────────
+# Idempotent order creation
+#
+# Retries of the same (user, event, quantity, amount) within the
+# seat-hold window get the order created the first time, including
+# retries that arrive while that first attempt is still in flight. A
+# cached order is only handed out again while `is_live` says its booking
+# is still pending: once it is paid, cancelled or expired (possibly in
+# another worker), the next request is a new purchase.
+# ─────────────────────────────────────────────
+_orders = TTLCache(ORDER_CACHE_SIZE, SEAT_HOLD_SECONDS)
+_inflight = {}
+
+
+async def idempotent_order(key: tuple, create, is_live=None):
+    cached = _orders.get(key)
+    if cached is not None and (is_live is None or await is_live(cached)):
+        return cached
+    if key in _inflight:
+        return await asyncio.shield(_inflight[key])
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await create()
+        _orders.set(key, result)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            future.cancel()
+
+
+def forget_order(key: tuple):
+    _orders.pop(key)
@@ -0,0 +1,151 @@
+import importlib
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fastapi import HTTPException, Request
+
+# ─────────────────────────────────────────────
+# Admission control for the expensive routes
+#
+# Token buckets per client IP and per email (auth) or user (payments),
+# plus a cap on concurrent auth requests. Everything is checked in route
+# dependencies / the first line of the handler, so a rejected request
+# costs no DB query and no bcrypt.
+#
+# Rules are "<requests>/<seconds>": a bucket of that many tokens that
+# refills evenly over the period. "0" disables a rule.
+#
+# The default backend is in-process, i.e. per worker. For several workers
+# point RATE_LIMIT_BACKEND at "module:factory" returning a RateLimitBackend
+# (e.g. backed by Redis).
+# ─────────────────────────────────────────────
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") == "1"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 100_000))
+# Behind Vercel's edge (or another proxy) the client is in X-Forwarded-For
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "1" if os.getenv("VERCEL") else "0") == "1"
+
+AUTH_IP_RULE = os.getenv("RATE_LIMIT_AUTH_IP", "30/60")
+AUTH_EMAIL_RULE = os.getenv("RATE_LIMIT_AUTH_EMAIL", "5/60")
+PAYMENT_USER_RULE = os.getenv("RATE_LIMIT_PAYMENT_USER", "30/60")
+AUTH_MAX_CONCURRENT = int(os.getenv("AUTH_MAX_CONCURRENT", 32))
+
+
+class RateLimitBackend(ABC):
+    @abstractmethod
+    def take(self, key: str, capacity: float, refill_per_sec: float) -> float:
+        """Take one token from `key`'s bucket. Returns 0 if allowed, else
+        the seconds until a token is available."""
+
+
+class MemoryBackend(RateLimitBackend):
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, refill_per_sec: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_sec)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / refill_per_sec
+            self._buckets[key] = (tokens, now)
+            # Least recently seen buckets go first; they are (nearly) full
+            # again anyway, so forgetting them only errs towards allowing.
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+
+def _load_backend(spec: str) -> RateLimitBackend:
+    if spec == "memory":
+        return MemoryBackend()
+    module, _, factory = spec.partition(":")
+    backend = getattr(importlib.import_module(module), factory)()
+    if not isinstance(backend, RateLimitBackend):
+        raise TypeError(f"RATE_LIMIT_BACKEND {spec!r} must return a RateLimitBackend, got {type(backend).__name__}")
+    return backend
+
+
+backend = _load_backend(RATE_LIMIT_BACKEND)
+
+
+def _too_many(retry_after: float):
+    raise HTTPException(
+        status_code=429,
+        detail="Too many requests, please retry later",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class Limit:
+    def __init__(self, name: str, rule: str):
+        self.name = name
+        count, _, seconds = rule.partition("/")
+        self.capacity = float(count)
+        self.refill_per_sec = self.capacity / float(seconds or 1)
+
+    def check(self, key):
+        if not RATE_LIMIT_ENABLED or self.capacity <= 0:
+            return
+        wait = backend.take(f"{self.name}:{key}", self.capacity, self.refill_per_sec)
+        if wait:
+            _too_many(wait)
+
+
+auth_ip_limit = Limit("auth_ip", AUTH_IP_RULE)
+auth_email_limit = Limit("auth_email", AUTH_EMAIL_RULE)
+payment_user_limit = Limit("payment_user", PAYMENT_USER_RULE)
+
+
+def client_ip(request: Request) -> str:
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class ConcurrencyLimit:
+    """Reject, rather than queue, requests beyond `limit` in flight."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._lock = threading.Lock()
+
+    async def __call__(self):
+        if not RATE_LIMIT_ENABLED or self.limit <= 0:
+            yield
+            return
+        with self._lock:
+            if self.active >= self.limit:
+                _too_many(1)
+            self.active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+auth_slot = ConcurrencyLimit(AUTH_MAX_CONCURRENT)
+
+
+# ─────────────────────────────────────────────
+# Route dependencies
+# ─────────────────────────────────────────────
+def limit_auth_ip(request: Request):
+    auth_ip_limit.check(client_ip(request))
+
+
+def limit_auth_email(email: str):
+    auth_email_limit.check(email.strip().lower())
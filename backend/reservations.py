@@ -0,0 +1,164 @@
+import asyncio
+import os
+from collections import Counter
+from datetime import timedelta
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal
+import models
+import seatfeed
+
+# ─────────────────────────────────────────────
+# Seat reservation engine
+#
+# Seats are taken with a single conditional UPDATE
+# (available_seats >= n), so concurrent buyers can never oversell and
+# never hold a row lock longer than that one statement's transaction.
+# Each successful hold creates a pending Booking that expires after
+# SEAT_HOLD_SECONDS; expired holds hand their seats back.
+#
+# Every state change on a booking is itself conditional on
+# status = 'pending', so a hold is released, cancelled or confirmed
+# exactly once.
+# ─────────────────────────────────────────────
+SEAT_HOLD_SECONDS = int(os.getenv("SEAT_HOLD_SECONDS", 600))
+HOLD_RELEASE_INTERVAL = float(os.getenv("HOLD_RELEASE_INTERVAL", 30))
+HOLD_RELEASE_BATCH = int(os.getenv("HOLD_RELEASE_BATCH", 500))
+
+
+def take_seats(db: Session, event_id: int, quantity: int):
+    row = db.execute(
+        update(models.Event)
+        .where(
+            models.Event.id == event_id,
+            models.Event.is_active == True,
+            models.Event.available_seats >= quantity,
+        )
+        .values(available_seats=models.Event.available_seats - quantity)
+        .returning(models.Event.price, models.Event.available_seats)
+        .execution_options(synchronize_session=False, seats_only=True)
+    ).first()
+    if row is None:
+        return None
+    seatfeed.record_seats(db, event_id, row.available_seats)
+    return row.price
+
+
+def return_seats(db: Session, seats_by_event: Counter):
+    for event_id, seats in seats_by_event.items():
+        available = db.execute(
+            update(models.Event)
+            .where(models.Event.id == event_id)
+            .values(available_seats=models.Event.available_seats + seats)
+            .returning(models.Event.available_seats)
+            .execution_options(synchronize_session=False, seats_only=True)
+        ).scalar()
+        if available is not None:
+            seatfeed.record_seats(db, event_id, available)
+
+
+def hold_seats(db: Session, user_id: int, event_id: int, quantity: int = 1,
+               hold_seconds: int = SEAT_HOLD_SECONDS) -> models.Booking:
+    price = take_seats(db, event_id, quantity)
+    if price is None:
+        db.rollback()
+        # Sold out may just mean abandoned holds nobody has swept yet
+        if release_expired_holds(db, event_id=event_id):
+            price = take_seats(db, event_id, quantity)
+    if price is None:
+        db.rollback()
+        exists = db.query(models.Event.id).filter(
+            models.Event.id == event_id, models.Event.is_active == True
+        ).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Event not found")
+        raise HTTPException(status_code=409, detail="Not enough seats available")
+
+    booking = models.Booking(
+        user_id=user_id,
+        event_id=event_id,
+        quantity=quantity,
+        amount=price * quantity,
+        status="pending",
+        hold_expires_at=models.utcnow() + timedelta(seconds=hold_seconds),
+    )
+    db.add(booking)
+    db.commit()
+    return booking
+
+
+def cancel_hold(db: Session, booking_id: int, user_id: int):
+    """Cancel a pending booking; returns its (event_id, quantity, amount) row or None."""
+    row = db.execute(
+        update(models.Booking)
+        .where(
+            models.Booking.id == booking_id,
+            models.Booking.user_id == user_id,
+            models.Booking.status == "pending",
+        )
+        .values(status="cancelled")
+        .returning(models.Booking.event_id, models.Booking.quantity, models.Booking.amount)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        db.rollback()
+        return None
+    return_seats(db, Counter({row.event_id: row.quantity}))
+    db.commit()
+    return row
+
+
+def release_expired_holds(db: Session, event_id: int = None, batch: int = HOLD_RELEASE_BATCH) -> int:
+    query = select(models.Booking.id).where(
+        models.Booking.status == "pending",
+        models.Booking.hold_expires_at < models.utcnow(),
+    )
+    if event_id is not None:
+        query = query.where(models.Booking.event_id == event_id)
+    ids = db.execute(query.limit(batch)).scalars().all()
+    if not ids:
+        db.rollback()
+        return 0
+
+    released = db.execute(
+        update(models.Booking)
+        .where(models.Booking.id.in_(ids), models.Booking.status == "pending")
+        .values(status="expired")
+        .returning(models.Booking.event_id, models.Booking.quantity)
+        .execution_options(synchronize_session=False)
+    ).all()
+    seats = Counter()
+    for row in released:
+        seats[row.event_id] += row.quantity
+    return_seats(db, seats)
+    db.commit()
+    return len(released)
+
+
+# ─────────────────────────────────────────────
+# Background sweeper
+# ─────────────────────────────────────────────
+def _sweep_once() -> int:
+    db = SessionLocal()
+    try:
+        total = 0
+        while True:
+            released = release_expired_holds(db)
+            total += released
+            if released < HOLD_RELEASE_BATCH:
+                return total
+    finally:
+        db.close()
+
+
+async def release_loop(interval: float = HOLD_RELEASE_INTERVAL):
+    while True:
+        try:
+            released = await run_in_threadpool(_sweep_once)
+            if released:
+                print(f"Released {released} expired seat holds")
+        except Exception as e:
+            print("Hold release error:", e)
+        await asyncio.sleep(interval)
@@ -0,0 +1,164 @@
+import os
+from datetime import date
+from sqlalchemy import Date, cast, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+import models
+
+# ─────────────────────────────────────────────
+# Sales rollups
+#
+# Confirmed bookings are summed into small tables in the same
+# transaction that confirms them: per event (all time, and per day), per
+# category and day, and per user. Reports read only these, so they never scan
+# bookings or take locks checkout needs. A confirmation batch is
+# aggregated here first: one upsert per (event, day) touched, not one per
+# booking, in key order so concurrent batches lock rows in the same order.
+#
+# Days are the booking's booked_at date, which rebuild() can recompute
+# from bookings alone. Anything that takes back a confirmed booking
+# (a refund, a cancellation) must call record_sales(..., sign=-1) in its
+# transaction.
+# ─────────────────────────────────────────────
+REPORTS_TOKEN = os.getenv("REPORTS_TOKEN")  # unset: no /reports routes
+
+_MEASURES = ("bookings", "tickets", "revenue")
+
+
+def _insert_for(dialect: str):
+    return {"postgresql": postgresql.insert, "sqlite": sqlite.insert}[dialect]
+
+
+def _add(db: Session, table, keys: tuple, totals: dict, measures: tuple = _MEASURES):
+    stmt = _insert_for(db.get_bind().dialect.name)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c[key] for key in keys],
+        set_={name: table.c[name] + stmt.excluded[name] for name in measures},
+    )
+    db.execute(stmt, [
+        {**dict(zip(keys, key)), **dict(zip(measures, values))}
+        for key, values in sorted(totals.items())
+    ])
+
+
+def _bump(totals: dict, key, bookings: int, tickets: int, revenue: float):
+    current = totals.get(key, (0, 0, 0.0))
+    totals[key] = (current[0] + bookings, current[1] + tickets, current[2] + revenue)
+
+
+def record_sales(db: Session, bookings, sign: int = 1):
+    """Add (sign=1) or take back (sign=-1) confirmed `bookings`: rows with
+    event_id, user_id, quantity, amount and booked_at. Doesn't commit."""
+    if not bookings:
+        return
+    event_ids = {b.event_id for b in bookings}
+    categories = dict(db.execute(
+        select(models.Event.id, models.Event.category).where(models.Event.id.in_(event_ids))
+    ).all())
+
+    by_event, by_event_day, by_category, by_user = {}, {}, {}, {}
+    for b in bookings:
+        day = b.booked_at.date()
+        measures = (sign, sign * b.quantity, sign * b.amount)
+        _bump(by_event, (b.event_id,), *measures)
+        _bump(by_event_day, (b.event_id, day), *measures)
+        _bump(by_category, (categories.get(b.event_id, ""), day), *measures)
+        _bump(by_user, (b.user_id,), *measures)
+
+    _add(db, models.EventSales.__table__, ("event_id",), by_event)
+    _add(db, models.EventSalesDaily.__table__, ("event_id", "day"), by_event_day)
+    _add(db, models.CategorySalesDaily.__table__, ("category", "day"), by_category)
+    _add(db, models.UserSpend.__table__, ("user_id",), by_user, ("bookings", "tickets", "total_spent"))
+
+
+def booking_day(dialect: str):
+    """SQL for a booking's booked_at date, matching record_sales' days."""
+    if dialect == "sqlite":
+        return func.date(models.Booking.booked_at)  # CAST AS DATE is numeric on SQLite
+    return cast(models.Booking.booked_at, Date)
+
+
+def rebuild(conn):
+    """Recompute every rollup from bookings. For backfills and repairs."""
+    booking, event = models.Booking, models.Event
+    day = booking_day(conn.dialect.name)
+    totals = (func.count(), func.sum(booking.quantity), func.sum(booking.amount))
+    confirmed = booking.status == "confirmed"
+
+    for model in (models.EventSales, models.EventSalesDaily, models.CategorySalesDaily, models.UserSpend):
+        conn.execute(delete(model))
+    conn.execute(insert(models.EventSales).from_select(
+        ["event_id", *_MEASURES],
+        select(booking.event_id, *totals).where(confirmed).group_by(booking.event_id),
+    ))
+    conn.execute(insert(models.EventSalesDaily).from_select(
+        ["event_id", "day", *_MEASURES],
+        select(booking.event_id, day, *totals).where(confirmed).group_by(booking.event_id, day),
+    ))
+    conn.execute(insert(models.CategorySalesDaily).from_select(
+        ["category", "day", *_MEASURES],
+        select(event.category, day, *totals)
+        .join(event, event.id == booking.event_id)
+        .where(confirmed)
+        .group_by(event.category, day),
+    ))
+    conn.execute(insert(models.UserSpend).from_select(
+        ["user_id", "bookings", "tickets", "total_spent"],
+        select(booking.user_id, *totals).where(confirmed).group_by(booking.user_id),
+    ))
+
+
+# ─────────────────────────────────────────────
+# Reports
+# ─────────────────────────────────────────────
+def _in_range(query, column, start: date, end: date):
+    if start is not None:
+        query = query.where(column >= start)
+    if end is not None:
+        query = query.where(column <= end)
+    return query
+
+
+def sales_report(db: Session, group: str, start: date = None, end: date = None, limit: int = 50) -> list:
+    """Totals per event, category or day between `start` and `end` (inclusive)."""
+    if group == "event" and start is None and end is None:
+        rollup = models.EventSales
+        key = rollup.event_id
+    elif group == "event":
+        rollup = models.EventSalesDaily
+        key = rollup.event_id
+    else:
+        rollup = models.CategorySalesDaily
+        key = rollup.category if group == "category" else rollup.day
+    revenue = func.sum(rollup.revenue)
+    query = select(
+        key.label("key"), func.sum(rollup.bookings).label("bookings"),
+        func.sum(rollup.tickets).label("tickets"), revenue.label("revenue"),
+    ).group_by(key)
+    if rollup is not models.EventSales:
+        query = _in_range(query, rollup.day, start, end)
+    query = query.order_by(key.desc() if group == "day" else revenue.desc()).limit(limit)
+    rows = db.execute(query).all()
+
+    titles = {}
+    if group == "event" and rows:
+        titles = dict(db.execute(
+            select(models.Event.id, models.Event.title).where(models.Event.id.in_([row.key for row in rows]))
+        ).all())
+    return [
+        {
+            "key": str(row.key), "title": titles.get(row.key),
+            "bookings": row.bookings, "tickets": row.tickets, "revenue": row.revenue,
+        }
+        for row in rows
+    ]
+
+
+def user_spend(db: Session, user_id: int) -> dict:
+    spend = models.UserSpend
+    row = db.execute(
+        select(spend.bookings, spend.tickets, spend.total_spent).where(spend.user_id == user_id)
+    ).first()
+    if row is None:
+        return {"user_id": user_id, "bookings": 0, "tickets": 0, "total_spent": 0.0}
+    return {"user_id": user_id, "bookings": row.bookings, "tickets": row.tickets, "total_spent": row.total_spent}
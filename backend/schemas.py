@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 
@@ -39,6 +39,10 @@ class EventResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class SuggestionResponse(BaseModel):
+    text: str
+    kind: str  # title, location or category
+
 
 # ─── Bookings ────────────────────────────────────────────────────────────────
 
@@ -46,6 +50,7 @@ class BookingResponse(BaseModel):
     id: int
     event_id: int
     amount: float
+    quantity: int = 1
     status: str
     booked_at: datetime
     event: EventResponse
@@ -53,11 +58,48 @@ class BookingResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class BookingSummaryResponse(BaseModel):
+    id: int
+    event_id: int
+    amount: float
+    quantity: int = 1
+    status: str
+    booked_at: datetime
+    event_title: str
+    event_date: datetime
+    event_location: str
+    event_category: str
+
+    class Config:
+        from_attributes = True
+
+
+class HoldRequest(BaseModel):
+    event_id: int
+    quantity: int = Field(1, ge=1, le=10)
+
+class HoldResponse(BaseModel):
+    booking_id: int
+    event_id: int
+    quantity: int
+    amount: float
+    status: str
+    hold_expires_at: Optional[datetime]
+
 
 # ─── Payment ─────────────────────────────────────────────────────────────────
 
 class CreateOrderRequest(BaseModel):
     event_id: int
+    quantity: int = Field(1, ge=1, le=10)
+
+class CreateOrderResponse(BaseModel):
+    order_id: str
+    booking_id: int
+    amount: float
+    currency: str
+    key_id: str
+    hold_expires_at: Optional[datetime]
 
 class VerifyPaymentRequest(BaseModel):
     razorpay_order_id: str
@@ -65,6 +107,14 @@ class VerifyPaymentRequest(BaseModel):
     razorpay_signature: str
     event_id: int
 
+class TestConfirmRequest(BaseModel):
+    razorpay_order_id: str
+    razorpay_payment_id: str
+
+class BookingStatusResponse(BaseModel):
+    booking_id: int
+    status: str
+
 
 # ─── User Profile ─────────────────────────────────────────────────────────────
 
@@ -76,4 +126,41 @@ class UserProfileResponse(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# ─── Bulk Import ─────────────────────────────────────────────────────────────
+
+class EventImportRow(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    description: Optional[str] = None
+    location: str = Field(min_length=1, max_length=200)
+    date: datetime
+    price: float = Field(ge=0)
+    category: str = Field(min_length=1, max_length=50)
+    image_url: Optional[str] = Field(None, max_length=500)
+    available_seats: int = Field(ge=0)
+    is_active: bool = True
+
+class ImportResponse(BaseModel):
+    rows_read: int
+    rows_written: int
+    rows_invalid: int
+    errors: list[str]
+    seconds: float
+    rows_per_sec: float
+
+
+# ─── Reports ─────────────────────────────────────────────────────────────────
+
+class SalesReportRow(BaseModel):
+    key: str  # event id, category or ISO date, by the report's group
+    title: Optional[str] = None  # event title, for group=event
+    bookings: int
+    tickets: int
+    revenue: float
+
+class UserSpendResponse(BaseModel):
+    user_id: int
+    bookings: int
+    tickets: int
+    total_spent: float
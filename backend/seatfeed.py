@@ -0,0 +1,155 @@
+import asyncio
+import json
+import os
+import threading
+import uuid
+from collections import deque
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# ─────────────────────────────────────────────
+# Live seat counts over server-sent events
+#
+# Seat changes are recorded on the Session (reservations.take_seats /
+# return_seats read the new count back with RETURNING) and handed to the
+# broadcaster on commit. Every SEAT_FEED_INTERVAL the broadcaster turns
+# everything that changed into one frame, {"<event_id>": seats, ...},
+# encoded once and written to every connected client. A thousand
+# clients cost one frame, not a thousand /events queries.
+#
+# Frame ids are "<process epoch>-<version>". A client reconnecting with
+# Last-Event-ID gets the merged frames it missed. If those have left the
+# history, or it was talking to another worker, it gets "event: reset"
+# and should refetch /events.
+#
+# Per process: with several workers each one only sees its own commits.
+# Off by default on Vercel, where functions can't hold a stream open.
+# ─────────────────────────────────────────────
+SEAT_FEED_ENABLED = os.getenv("SEAT_FEED_ENABLED", "0" if os.getenv("VERCEL") else "1") == "1"
+SEAT_FEED_INTERVAL = float(os.getenv("SEAT_FEED_INTERVAL", 0.5))
+SEAT_FEED_HEARTBEAT = float(os.getenv("SEAT_FEED_HEARTBEAT", 15))
+SEAT_FEED_HISTORY = int(os.getenv("SEAT_FEED_HISTORY", 256))
+SEAT_FEED_MAX_CLIENTS = int(os.getenv("SEAT_FEED_MAX_CLIENTS", 10000))
+
+_EPOCH = uuid.uuid4().hex[:8]
+_SEATS_KEY = "seat_changes"
+
+
+def _frame(version: int, seats: dict) -> bytes:
+    data = json.dumps({str(k): v for k, v in seats.items()}, separators=(",", ":"))
+    return f"id: {_EPOCH}-{version}\nevent: seats\ndata: {data}\n\n".encode()
+
+
+def _reset_frame(version: int) -> bytes:
+    return f"id: {_EPOCH}-{version}\nevent: reset\ndata: {{}}\n\n".encode()
+
+
+class SeatBroadcaster:
+    def __init__(self, interval: float = SEAT_FEED_INTERVAL, history: int = SEAT_FEED_HISTORY):
+        self.interval = interval
+        self.version = 0
+        self.clients = 0
+        self._pending = {}
+        self._lock = threading.Lock()  # publish() runs on threadpool threads
+        self._frames = deque(maxlen=history)  # (version, seats, encoded)
+        self._changed = None
+
+    def publish(self, seats: dict):
+        with self._lock:
+            self._pending.update(seats)
+
+    def start(self) -> asyncio.Task:
+        self._changed = asyncio.Event()
+        return asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def running(self) -> bool:
+        return self._changed is not None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            seats, self._pending = self._pending, {}
+        if not seats:
+            return
+        self.version += 1
+        self._frames.append((self.version, seats, _frame(self.version, seats)))
+        # Wake every waiting client at once; they all send the same bytes
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def since(self, version: int):
+        """Frame bytes covering everything after `version`, or None if
+        that's no longer in the history."""
+        if version == self.version:
+            return b""
+        newer = [frame for frame in self._frames if frame[0] > version]
+        if version > self.version or not newer or newer[0][0] != version + 1:
+            return None
+        if len(newer) == 1:
+            return newer[0][2]
+        merged = {}
+        for _, seats, _ in newer:
+            merged.update(seats)
+        return _frame(self.version, merged)
+
+    def parse_last_event_id(self, last_event_id: str):
+        epoch, _, version = (last_event_id or "").partition("-")
+        if epoch != _EPOCH or not version.isdigit():
+            return None
+        return int(version)
+
+    async def stream(self, last_event_id: str = None):
+        self.clients += 1
+        try:
+            yield b"retry: 3000\n: connected\n\n"
+            version = self.version
+            if last_event_id:
+                resumed = self.parse_last_event_id(last_event_id)
+                missed = None if resumed is None else self.since(resumed)
+                if missed is None:
+                    yield _reset_frame(version)
+                elif missed:
+                    yield missed
+
+            while True:
+                # Frames flushed while this client was suspended in a yield
+                # have already fired their event; send those before waiting
+                if self.version == version:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), SEAT_FEED_HEARTBEAT)
+                    except asyncio.TimeoutError:
+                        yield b": ping\n\n"
+                        continue
+                missed = self.since(version)
+                version = self.version
+                # A client too slow to keep up with the history starts over
+                yield _reset_frame(version) if missed is None else missed
+        finally:
+            self.clients -= 1
+
+
+broadcaster = SeatBroadcaster()
+
+
+# ─────────────────────────────────────────────
+# Session hooks: publish only what actually committed
+# ─────────────────────────────────────────────
+def record_seats(db: Session, event_id: int, available_seats: int):
+    db.info.setdefault(_SEATS_KEY, {})[event_id] = available_seats
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session):
+    seats = session.info.pop(_SEATS_KEY, None)
+    if seats and SEAT_FEED_ENABLED:
+        broadcaster.publish(seats)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop(_SEATS_KEY, None)
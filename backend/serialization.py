@@ -0,0 +1,46 @@
+import os
+from pydantic import TypeAdapter
+import models
+import schemas
+
+# ─────────────────────────────────────────────
+# Catalog JSON encoding
+#
+# JSON_MODE=fast (default) selects only the EventResponse columns and
+# encodes the rows straight to bytes with orjson. The data comes from our
+# own database, so re-validating each row through Pydantic buys nothing.
+# JSON_MODE=pydantic keeps the ORM -> EventResponse -> JSON path.
+# Output is byte-compatible: same keys, order and datetime format.
+# ─────────────────────────────────────────────
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+JSON_MODE = os.getenv("JSON_MODE", "fast").lower()
+FAST_JSON = JSON_MODE == "fast" and orjson is not None
+
+EVENT_COLUMNS = [getattr(models.Event, name) for name in schemas.EventResponse.model_fields]
+
+_events_adapter = TypeAdapter(list[schemas.EventResponse])
+
+
+def project_events(query):
+    """Narrow an Event query to the response columns when in fast mode."""
+    return query.with_entities(*EVENT_COLUMNS) if FAST_JSON else query
+
+
+def dumps(value) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+
+
+def encode_event(row) -> bytes:
+    if FAST_JSON:
+        return dumps(row._asdict())
+    return schemas.EventResponse.model_validate(row).model_dump_json().encode()
+
+
+def encode_events(rows) -> bytes:
+    if FAST_JSON:
+        return dumps([row._asdict() for row in rows])
+    return _events_adapter.dump_json(_events_adapter.validate_python(rows, from_attributes=True))
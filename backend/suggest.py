@@ -0,0 +1,202 @@
+import asyncio
+import heapq
+import os
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+import models
+
+# ─────────────────────────────────────────────
+# Typeahead over event titles, locations and categories
+#
+# A sorted list of (key, kind, display, word) tuples, one per word suffix:
+# "Coldplay India Tour" is reachable from "col", "ind" and "tou". A query
+# is a bisect to its prefix plus a scan of at most SUGGEST_SCAN entries,
+# so lookups never touch the database. Results are memoized per prefix
+# until the index next changes; seat counts don't change it.
+#
+# Kept current by Session hooks on commit, for Event objects added,
+# changed or deleted through a Session. Bulk UPDATEs are not tracked (only
+# seat counts use them). Core writes such as bulk imports call expire().
+# Commits in other workers show up at the next reload, every
+# SUGGEST_REFRESH seconds.
+# ─────────────────────────────────────────────
+SUGGEST_LIMIT = int(os.getenv("SUGGEST_LIMIT", 8))
+SUGGEST_SCAN = int(os.getenv("SUGGEST_SCAN", 256))
+SUGGEST_REFRESH = float(os.getenv("SUGGEST_REFRESH", 300))
+SUGGEST_CACHE_SIZE = int(os.getenv("SUGGEST_CACHE_SIZE", 4096))  # results per prefix, until the next change
+SUGGEST_MAX_WORDS = 4  # suffixes indexed per title/location
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_CHANGES_KEY = "suggest_changes"
+
+
+def normalize(text: str) -> str:
+    return " ".join(_TOKEN_RE.findall(text.casefold()))
+
+
+def _entries(title: str, location: str, category: str) -> tuple:
+    return (("title", title), ("location", location), ("category", category))
+
+
+def _keys(kind: str, display: str) -> set:
+    words = normalize(display).split(" ")
+    return {(" ".join(words[i:]), kind, display, i) for i in range(min(len(words), SUGGEST_MAX_WORDS)) if words[i]}
+
+
+class SuggestIndex:
+    def __init__(self):
+        self.loaded = False
+        self.expires_at = 0.0
+        self._keys = []  # sorted (key, kind, display, word position)
+        self._counts = {}  # (kind, display) -> active events
+        self._events = {}  # event id -> its (kind, display) entries
+        self._replay = None  # changes committed while a reload reads the DB
+        self._results = {}  # (prefix, limit) -> results, dropped on any change
+        self._lock = threading.Lock()
+
+    def expire(self):
+        self.expires_at = 0.0
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def load(self, rows):
+        """Replace the index with `rows` of (id, title, location, category)."""
+        with self._lock:
+            self._replay = []
+        try:
+            events, counts = {}, Counter()
+            for event_id, title, location, category in rows:
+                events[event_id] = _entries(title, location, category)
+                counts.update(events[event_id])
+            keys = sorted(key for entry in counts for key in _keys(*entry))
+        except BaseException:
+            with self._lock:
+                self._replay = None
+            raise
+        with self._lock:
+            self._keys, self._counts, self._events = keys, dict(counts), events
+            self._results = {}
+            # The snapshot may predate these; applying them again is harmless
+            replay, self._replay = self._replay, None
+            for changes in replay:
+                self._apply(changes)
+            self.loaded = True
+            self.expires_at = time.monotonic() + SUGGEST_REFRESH
+
+    def apply(self, changes: dict):
+        """`changes` maps event id -> (title, location, category), or None
+        for events that were deleted or deactivated."""
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append(changes)
+            self._apply(changes)
+
+    def _apply(self, changes: dict):
+        self._results.clear()
+        for event_id, fields in changes.items():
+            for entry in self._events.pop(event_id, ()):
+                count = self._counts[entry] - 1
+                if count:
+                    self._counts[entry] = count
+                    continue
+                del self._counts[entry]
+                for key in _keys(*entry):
+                    i = bisect_left(self._keys, key)
+                    if i < len(self._keys) and self._keys[i] == key:
+                        del self._keys[i]
+            if fields is None:
+                continue
+            self._events[event_id] = _entries(*fields)
+            for entry in self._events[event_id]:
+                count = self._counts.get(entry, 0) + 1
+                self._counts[entry] = count
+                if count == 1:
+                    for key in _keys(*entry):
+                        insort(self._keys, key)
+
+    def search(self, query: str, limit: int = SUGGEST_LIMIT) -> list:
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        with self._lock:
+            results = self._results.get((prefix, limit))
+            if results is not None:
+                return results
+            keys = self._keys
+            start = bisect_left(keys, (prefix,))
+            end = bisect_left(keys, (prefix + "\U0010ffff",), start, min(len(keys), start + SUGGEST_SCAN))
+            best = {}
+            for key, kind, display, word in keys[start:end]:
+                if best.get((kind, display), SUGGEST_MAX_WORDS) > word:
+                    best[(kind, display)] = word
+            # Matches on the first word first, then the most events, then the shortest
+            counts = self._counts
+            ranked = heapq.nsmallest(limit, ((word, -counts[e], len(e[1]), e[1], e[0]) for e, word in best.items()))
+            results = [{"text": display, "kind": kind} for *_, display, kind in ranked]
+            if len(self._results) >= SUGGEST_CACHE_SIZE:
+                self._results.clear()
+            self._results[(prefix, limit)] = results
+            return results
+
+
+index = SuggestIndex()
+
+
+def _catalog_rows():
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return db.query(
+            models.Event.id, models.Event.title, models.Event.location, models.Event.category,
+        ).filter(models.Event.is_active == True).all()
+    finally:
+        db.close()
+
+
+def reload():
+    index.load(_catalog_rows())
+
+
+_reloading = None
+
+
+async def ensure_loaded():
+    """Load on first use; afterwards reload in the background when stale."""
+    global _reloading
+    if index.stale and (_reloading is None or _reloading.done()):
+        _reloading = asyncio.ensure_future(run_in_threadpool(reload))
+    if not index.loaded:
+        await asyncio.shield(_reloading)
+
+
+# ─────────────────────────────────────────────
+# Session hooks: apply only what actually committed
+# ─────────────────────────────────────────────
+@event.listens_for(Session, "after_flush")
+def _track_event_changes(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, models.Event):
+            live = obj not in session.deleted and obj.is_active is not False
+            fields = (obj.title, obj.location, obj.category) if live else None
+            session.info.setdefault(_CHANGES_KEY, {})[obj.id] = fields
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_on_commit(session):
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if changes:
+        index.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_on_rollback(session):
+    session.info.pop(_CHANGES_KEY, None)
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import {
   View, Text, TextInput, TouchableOpacity, FlatList,
   StyleSheet, ActivityIndicator, RefreshControl,
@@ -17,6 +17,7 @@ const CATEGORY_COLORS = {
   Food: '#ff9800', Art: '#9c27b0', Comedy: '#ffeb3b',
   Business: '#2196f3', All: '#6c47ff',
 };
+const SUGGESTION_ICONS = { title: '🎟️', location: '📍', category: '🏷️' };
 
 export default function HomeScreen({ navigation, route }) {
   const { token, name } = route.params;
@@ -27,15 +28,28 @@ export default function HomeScreen({ navigation, route }) {
   const [search, setSearch] = useState('');
   const [selectedCategory, setSelectedCategory] = useState('All');
   const [searchTimeout, setSearchTimeout] = useState(null);
+  const [suggestions, setSuggestions] = useState([]);
+  const suggestSeq = useRef(0);
+  const etagCache = useRef({});
 
   const fetchEvents = useCallback(async (searchVal = '', category = 'All') => {
     try {
       let url = `${BASE_URL}/events?`;
       if (searchVal.trim()) url += `search=${encodeURIComponent(searchVal.trim())}&`;
       if (category !== 'All') url += `category=${encodeURIComponent(category)}`;
-      const res = await fetch(url);
+      // Revalidate with the last ETag: unchanged lists come back as an empty 304
+      const cached = etagCache.current[url];
+      const res = await fetch(url, { headers: cached ? { 'If-None-Match': cached.etag } : {} });
+      if (res.status === 304 && cached) {
+        setEvents(cached.data);
+        return;
+      }
       const data = await res.json();
-      if (res.ok) setEvents(data);
+      if (res.ok) {
+        setEvents(data);
+        const etag = res.headers.get('ETag');
+        if (etag) etagCache.current[url] = { etag, data };
+      }
     } catch (err) {
       console.error('Fetch events error:', err);
     } finally {
@@ -46,11 +60,115 @@ export default function HomeScreen({ navigation, route }) {
 
   useEffect(() => { fetchEvents(search, selectedCategory); }, [selectedCategory]);
 
+  // Live seat counts: the server pushes {eventId: seats} frames over
+  // server-sent events, so the list doesn't have to be refetched to see them.
+  const filtersRef = useRef({ search: '', category: 'All' });
+  filtersRef.current = { search, category: selectedCategory };
+
+  useEffect(() => {
+    let xhr = null;
+    let retryTimer = null;
+    let lastEventId = null;
+    let closed = false;
+
+    const applySeats = (seats) => {
+      setEvents(prev => prev.map(e => (
+        seats[e.id] !== undefined ? { ...e, available_seats: seats[e.id] } : e
+      )));
+    };
+
+    const handleMessage = (raw) => {
+      let type = 'message';
+      let data = '';
+      raw.split('\n').forEach(line => {
+        if (line.startsWith('id: ')) lastEventId = line.slice(4);
+        else if (line.startsWith('event: ')) type = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      });
+      if (type === 'seats') applySeats(JSON.parse(data));
+      // Missed updates the server can no longer replay: start from a fresh list
+      else if (type === 'reset') {
+        etagCache.current = {};
+        fetchEvents(filtersRef.current.search, filtersRef.current.category);
+      }
+    };
+
+    const connect = () => {
+      let seen = 0;
+      xhr = new XMLHttpRequest();
+      xhr.open('GET', `${BASE_URL}/events/seats/stream`);
+      xhr.setRequestHeader('Accept', 'text/event-stream');
+      if (lastEventId) xhr.setRequestHeader('Last-Event-ID', lastEventId);
+      xhr.onprogress = () => {
+        const pending = xhr.responseText.slice(seen);
+        const end = pending.lastIndexOf('\n\n');
+        if (end < 0) return;
+        seen += end + 2;
+        pending.slice(0, end).split('\n\n').forEach(handleMessage);
+        // responseText keeps growing; start a fresh request now and then
+        if (seen > 512 * 1024) xhr.abort();
+      };
+      xhr.onloadend = () => {
+        // 204: live updates are off on this server, don't keep asking
+        if (closed || xhr.status === 204) return;
+        retryTimer = setTimeout(connect, seen > 512 * 1024 ? 0 : 3000);
+      };
+      xhr.send();
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (xhr) xhr.abort();
+    };
+  }, [fetchEvents]);
+
+  const fetchSuggestions = async (text) => {
+    const seq = ++suggestSeq.current;
+    try {
+      const res = await fetch(`${BASE_URL}/events/suggest?q=${encodeURIComponent(text.trim())}`);
+      const data = await res.json();
+      // Drop answers to keystrokes the user has already typed past
+      if (res.ok && seq === suggestSeq.current) setSuggestions(data);
+    } catch (err) {
+      console.error('Suggest error:', err);
+    }
+  };
+
+  const closeSuggestions = () => {
+    suggestSeq.current++;
+    setSuggestions([]);
+    if (searchTimeout) clearTimeout(searchTimeout);
+  };
+
+  // Typing only asks for completions; the full /events search runs on submit or pick
   const handleSearch = (text) => {
     setSearch(text);
+    if (!text.trim()) {
+      closeSuggestions();
+      fetchEvents('', selectedCategory);
+      return;
+    }
     if (searchTimeout) clearTimeout(searchTimeout);
-    const t = setTimeout(() => fetchEvents(text, selectedCategory), 500);
-    setSearchTimeout(t);
+    setSearchTimeout(setTimeout(() => fetchSuggestions(text), 150));
+  };
+
+  const runSearch = (text) => {
+    closeSuggestions();
+    setSearch(text);
+    fetchEvents(text, selectedCategory);
+  };
+
+  const pickSuggestion = (item) => {
+    if (item.kind !== 'category' || !CATEGORIES.includes(item.text)) {
+      runSearch(item.text);
+      return;
+    }
+    closeSuggestions();
+    setSearch('');
+    if (item.text === selectedCategory) fetchEvents('', item.text);
+    else setSelectedCategory(item.text);
   };
 
   const handleRefresh = () => {
@@ -135,6 +253,8 @@ export default function HomeScreen({ navigation, route }) {
             placeholderTextColor="#888"
             value={search}
             onChangeText={handleSearch}
+            onSubmitEditing={() => runSearch(search)}
+            returnKeyType="search"
           />
           {search.length > 0 && (
             <TouchableOpacity onPress={() => handleSearch('')}>
@@ -142,6 +262,21 @@ export default function HomeScreen({ navigation, route }) {
             </TouchableOpacity>
           )}
         </View>
+
+        {suggestions.length > 0 && (
+          <View style={styles.suggestions}>
+            {suggestions.map((item) => (
+              <TouchableOpacity
+                key={`${item.kind}:${item.text}`}
+                style={styles.suggestionRow}
+                onPress={() => pickSuggestion(item)}
+              >
+                <Text style={styles.suggestionIcon}>{SUGGESTION_ICONS[item.kind] || '🔍'}</Text>
+                <Text style={styles.suggestionText} numberOfLines={1}>{item.text}</Text>
+              </TouchableOpacity>
+            ))}
+          </View>
+        )}
       </View>
 
       {/* Categories */}
@@ -213,6 +348,16 @@ const styles = StyleSheet.create({
   searchIcon: { fontSize: 16, marginRight: 8 },
   searchInput: { flex: 1, color: '#fff', fontSize: 15, paddingVertical: 12 },
   clearText: { color: '#888', fontSize: 16, paddingLeft: 8 },
+  suggestions: {
+    backgroundColor: '#0f0f1a', borderRadius: 12, marginTop: 6,
+    borderWidth: 1, borderColor: '#2a2a45', overflow: 'hidden',
+  },
+  suggestionRow: {
+    flexDirection: 'row', alignItems: 'center', paddingVertical: 10, paddingHorizontal: 14,
+    borderBottomWidth: 1, borderBottomColor: '#1a1a2e',
+  },
+  suggestionIcon: { fontSize: 14, marginRight: 10 },
+  suggestionText: { flex: 1, color: '#ddd', fontSize: 14 },
   categoriesBar: { maxHeight: 56 },
   categoriesScroll: { paddingHorizontal: 16, paddingVertical: 10, gap: 8, alignItems: 'center' },
   catChip: {